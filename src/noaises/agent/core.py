@@ -1,32 +1,85 @@
-"""Agent core — one-shot query to Claude via the Agent SDK.
-
-Uses query() for each interaction so the system prompt can be rebuilt
-per turn with fresh memory context. We maintain conversation history
-in our own memory module — the SDK doesn't hold state.
+"""Agent core — queries Claude via the Agent SDK over pre-connected clients.
+
+Each ``ClaudeSDKClient`` spawns a ``claude`` CLI subprocess and pays its
+startup/auth cost on connect. ``ClientPool`` connects the next turn's
+client in the background (while the user is still speaking), keyed by its
+options — system prompt included — so a turn only pays the LLM round-trip.
+Each client serves one turn: the system prompt is rebuilt per turn with
+fresh memory context, and conversation history lives in our own session
+log, not in the SDK.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, AsyncGenerator
+import asyncio
+import io
+import os
+import re
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Literal, NoReturn
+
+# Skip the SDK's per-connect ``claude -v`` compatibility probe; a version
+# mismatch still surfaces as an error from the CLI itself. Must be set
+# before the SDK is imported (see _lazy_sdk).
+os.environ.setdefault("CLAUDE_AGENT_SDK_SKIP_VERSION_CHECK", "1")
 
 from ..config import settings
-from ..logger import log
-from claude_agent_sdk import (
-    AssistantMessage,
-    ClaudeAgentOptions,
-    TextBlock,
-    ToolUseBlock,
-    ToolResultBlock,
-    ClaudeSDKClient,
-)
-from claude_agent_sdk.types import StreamEvent
-from claude_agent_sdk._errors import CLIConnectionError
+from ..logger import log, log_enabled
 
 if TYPE_CHECKING:
+    import anthropic
+    from claude_agent_sdk import (
+        ClaudeAgentOptions,
+        ClaudeSDKClient,
+        TextBlock,
+        ToolResultBlock,
+        ToolUseBlock,
+    )
     from noaises.interrupt.controller import InterruptController
 
 
+# The SDK's package init pulls in its transport, types and MCP glue — a
+# noticeable share of cold start. Defer it until the first agent call.
+_SDK: SimpleNamespace | None = None
+
+
+def _lazy_sdk() -> SimpleNamespace:
+    """Import the Claude Agent SDK on first use and cache its symbols."""
+    global _SDK
+    if _SDK is None:
+        from claude_agent_sdk import (
+            AssistantMessage,
+            ClaudeAgentOptions,
+            ClaudeSDKClient,
+            TextBlock,
+            ToolResultBlock,
+            ToolUseBlock,
+        )
+        from claude_agent_sdk._errors import CLIConnectionError
+        from claude_agent_sdk.types import StreamEvent
+
+        _SDK = SimpleNamespace(
+            AssistantMessage=AssistantMessage,
+            ClaudeAgentOptions=ClaudeAgentOptions,
+            ClaudeSDKClient=ClaudeSDKClient,
+            TextBlock=TextBlock,
+            ToolResultBlock=ToolResultBlock,
+            ToolUseBlock=ToolUseBlock,
+            CLIConnectionError=CLIConnectionError,
+            StreamEvent=StreamEvent,
+            # TextBlock is absent on purpose — already covered by text_delta events.
+            stream_block_handlers={
+                ToolUseBlock: _on_stream_tool_use,
+                ToolResultBlock: _on_stream_tool_result,
+            },
+        )
+    return _SDK
+
+
 @dataclass
 class AgentStreamEvent:
     """Event emitted by stream_agent_deltas().
@@ -46,7 +99,7 @@ class AgentStreamEvent:
     was_interrupted: bool = False
 
 
-ALLOWED_TOOLS = [
+ALLOWED_TOOLS: tuple[str, ...] = (
     "Task",
     "Bash",
     "Glob",
@@ -56,22 +109,96 @@ ALLOWED_TOOLS = [
     "Write",
     "WebFetch",
     "WebSearch",
-]
+)
+# ClaudeAgentOptions expects a list — shared when no extra tools are given.
+_ALLOWED_LIST = list(ALLOWED_TOOLS)
+
+
+Tier = Literal["simple", "complex"]
+
+MODEL_TIERS: dict[Tier, str] = {
+    "simple": "claude-haiku-4-5",
+    "complex": "claude-opus-4-5",
+}
+FALLBACK_MODEL = "claude-sonnet-4-5"
+
+# Whole words that suggest a turn needs tools (files, code, the web, the
+# screen/camera, memory); matched case-insensitively
+_TOOL_HINT = re.compile(
+    r"\b(?:files?|folders?|director(?:y|ies)|code|scripts?|commands?"
+    r"|search(?:es|ed|ing)?|google|browse|web|internet|look\s+up"
+    r"|run|execute|install|edit|write|read|open|download"
+    r"|screen|camera|remember|forget|memory)\b",
+    re.IGNORECASE,
+)
+_SIMPLE_MAX_CHARS = 80
+
+
+def select_tier(user_text: str) -> Tier:
+    """Cheap heuristic: short chit-chat that needs no tools goes to Haiku.
+
+    Long messages (which include attached vision/screenshot context) and
+    messages with a tool hint word go to the complex tier.
+    """
+    if len(user_text) >= _SIMPLE_MAX_CHARS or _TOOL_HINT.search(user_text):
+        return "complex"
+    return "simple"
+
+
+_OPTIONS_CACHE_SIZE = 8
+_options_cache: OrderedDict[tuple, ClaudeAgentOptions] = OrderedDict()
 
 
 def create_options(
     system_prompt: str,
     mcp_servers: dict[str, Any] | None = None,
-    extra_allowed_tools: list[str] | None = None,
+    extra_allowed_tools: Sequence[str] | None = None,
     include_partial_messages: bool = False,
+    tier: Tier = "complex",
+) -> ClaudeAgentOptions:
+    """Create agent options with a dynamic system prompt and optional MCP servers.
+
+    *tier* picks the model: Haiku for ``simple`` turns, Opus for ``complex``.
+    Results are memoized in a small LRU, so repeated turns with the same
+    prompt and servers reuse one options object.
+    """
+    key = (
+        system_prompt,
+        # Cached options keep the server configs alive, so ids stay unique.
+        tuple((name, id(cfg)) for name, cfg in (mcp_servers or {}).items()),
+        tuple(extra_allowed_tools or ()),
+        include_partial_messages,
+        tier,
+    )
+    options = _options_cache.get(key)
+    if options is not None:
+        _options_cache.move_to_end(key)
+        return options
+
+    options = _build_options(
+        system_prompt, mcp_servers, extra_allowed_tools, include_partial_messages, tier
+    )
+    _options_cache[key] = options
+    if len(_options_cache) > _OPTIONS_CACHE_SIZE:
+        _options_cache.popitem(last=False)
+    return options
+
+
+def _build_options(
+    system_prompt: str,
+    mcp_servers: dict[str, Any] | None,
+    extra_allowed_tools: Sequence[str] | None,
+    include_partial_messages: bool,
+    tier: Tier,
 ) -> ClaudeAgentOptions:
-    """Create agent options with a dynamic system prompt and optional MCP servers."""
-    allowed = ALLOWED_TOOLS + (extra_allowed_tools or [])
-    return ClaudeAgentOptions(
+    allowed = (
+        [*ALLOWED_TOOLS, *extra_allowed_tools] if extra_allowed_tools else _ALLOWED_LIST
+    )
+    return _lazy_sdk().ClaudeAgentOptions(
         system_prompt=system_prompt,
         allowed_tools=allowed,
-        model="claude-opus-4-5",
-        fallback_model="claude-sonnet-4-5",
+        model=MODEL_TIERS[tier],
+        fallback_model=FALLBACK_MODEL,
         permission_mode="acceptEdits",
         mcp_servers=mcp_servers or {},
         setting_sources=["project"],
@@ -80,6 +207,150 @@ def create_options(
     )
 
 
+@dataclass(eq=False)  # identity-hashed: tracked in ClientPool._live
+class WarmClient:
+    """A ``ClaudeSDKClient`` connected ahead of the turn that will use it.
+
+    The SDK's anyio task group must be entered and exited from the same
+    task, so connect/disconnect run on a dedicated ``owner`` task rather
+    than on whichever coroutine acquires the client.
+    """
+
+    client: ClaudeSDKClient
+    options_key: tuple
+    model: str
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    closing: asyncio.Event = field(default_factory=asyncio.Event)
+    owner: asyncio.Task | None = None
+
+
+def _options_key(options: ClaudeAgentOptions) -> tuple:
+    """Fingerprint the options a client is launched with, prompt included.
+
+    The model is left out — a connected client can switch models, so a
+    spare serves either tier.
+    """
+    return (
+        options.system_prompt,
+        options.fallback_model,
+        frozenset(options.mcp_servers or {}),
+        tuple(options.allowed_tools),
+        options.include_partial_messages,
+    )
+
+
+class ClientPool:
+    """Connects agent clients ahead of time; each one serves a single turn.
+
+    A client is disconnected once its turn ends, so every turn starts a
+    fresh CLI session with that turn's system prompt — conversation
+    context comes from the session summary, not from the SDK.
+    :meth:`prewarm` connects a spare for the options the next turn is
+    expected to use; :meth:`acquire` takes it when the options match.
+    """
+
+    def __init__(self) -> None:
+        self._spares: dict[tuple, WarmClient] = {}
+        self._live: set[WarmClient] = set()
+
+    def prewarm(self, options: ClaudeAgentOptions) -> None:
+        """Start connecting a spare client for *options* in the background.
+
+        Spares for other options are retired — they predicted a turn that
+        won't happen. Connect failures are logged; the turn then connects
+        again on its own.
+        """
+        key = _options_key(options)
+        warm = self._spares.get(key)
+        if warm is not None and not warm.owner.done():
+            return
+        self._retire_spares()
+        self._spares[key] = self._spawn(options, key)
+
+    @asynccontextmanager
+    async def acquire(
+        self, options: ClaudeAgentOptions
+    ) -> AsyncIterator[ClaudeSDKClient]:
+        """Yield a connected client for *options*, disconnecting it afterwards."""
+        key = _options_key(options)
+        warm = self._spares.pop(key, None)
+        if warm is None or warm.owner.done():
+            self._retire_spares()
+            warm = self._spawn(options, key)
+        try:
+            await _wait_connected(warm)
+            if warm.model != options.model:
+                await warm.client.set_model(options.model)
+            yield warm.client
+        finally:
+            warm.closing.set()
+
+    async def close(self) -> None:
+        """Disconnect every client. Call once on shutdown."""
+        self._spares.clear()
+        owners = []
+        for warm in self._live:
+            warm.closing.set()
+            owners.append(warm.owner)
+        if owners:
+            await asyncio.gather(*owners, return_exceptions=True)
+
+    def _spawn(self, options: ClaudeAgentOptions, key: tuple) -> WarmClient:
+        warm = WarmClient(
+            _lazy_sdk().ClaudeSDKClient(options=options), key, options.model
+        )
+        warm.owner = asyncio.create_task(self._own(warm))
+        self._live.add(warm)
+        warm.owner.add_done_callback(lambda task: self._owner_done(warm, task))
+        return warm
+
+    def _retire_spares(self) -> None:
+        for warm in self._spares.values():
+            warm.closing.set()
+        self._spares.clear()
+
+    def _owner_done(self, warm: WarmClient, task: asyncio.Task) -> None:
+        self._live.discard(warm)
+        if self._spares.get(warm.options_key) is warm:
+            del self._spares[warm.options_key]
+        # Retrieving the exception here also keeps asyncio from reporting
+        # it as never retrieved
+        exc = None if task.cancelled() else task.exception()
+        if exc is not None and not _is_transport_cleanup_error(exc):
+            log("WARN", f"[agent] Agent client failed: {exc}")
+
+    @staticmethod
+    async def _own(warm: WarmClient) -> None:
+        """Owner task — holds the client's connection open until closing."""
+        await warm.client.connect()
+        try:
+            warm.ready.set()
+            await warm.closing.wait()
+        finally:
+            await warm.client.disconnect()
+
+
+async def _wait_connected(warm: WarmClient) -> None:
+    """Wait for *warm* to connect, re-raising its owner's error if it failed."""
+    if not warm.ready.is_set():
+        waiter = asyncio.ensure_future(warm.ready.wait())
+        try:
+            await asyncio.wait(
+                (waiter, warm.owner), return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            waiter.cancel()
+    if warm.owner.done():
+        warm.owner.result()  # re-raises a connect error
+        raise RuntimeError("agent client closed before its turn")
+
+
+client_pool = ClientPool()
+
+
+_CLEANUP_MARKER = "not ready for writing"
+
+
 def _is_transport_cleanup_error(exc: BaseException) -> bool:
     """Check if an exception is the SDK transport cleanup race condition.
 
@@ -88,41 +359,136 @@ def _is_transport_cleanup_error(exc: BaseException) -> bool:
     task group — but a lingering handler may try to write after the transport
     is already closed, raising ``CLIConnectionError``. The actual response
     has already been collected, so this is safe to swallow.
+
+    Groups, nested ones included (``except*`` keeps the original nesting),
+    qualify only if every leaf is the race; subclasses such as
+    ``CLINotFoundError`` never do.
+    """
+    if type(exc) is _lazy_sdk().CLIConnectionError:
+        msg = exc.args[0] if exc.args else ""
+        return isinstance(msg, str) and _CLEANUP_MARKER in msg
+    if isinstance(exc, BaseExceptionGroup):
+        return all(map(_is_transport_cleanup_error, exc.exceptions))
+    return False
+
+
+def _reraise(eg: BaseExceptionGroup) -> NoReturn:
+    """Re-raise an ``except*`` match without wrapping a lone error in a group."""
+    if len(eg.exceptions) == 1:
+        raise eg.exceptions[0]
+    raise eg
+
+
+# ── Simple-turn fast path (direct HTTP API, no CLI subprocess) ──────
+
+# Tool-instruction sections of the system prompt (the memory and camera
+# meta prompts) — irrelevant when no tools are available.
+_TOOL_SECTION_RE = re.compile(
+    r"^## (?:Memory System|Camera / Vision)\b.*?(?=^## |\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+
+_http_client: anthropic.AsyncAnthropic | None = None
+
+
+def _get_http_client() -> anthropic.AsyncAnthropic:
+    global _http_client
+    if _http_client is None:
+        import anthropic
+
+        _http_client = anthropic.AsyncAnthropic(timeout=30)
+    return _http_client
+
+
+def fast_path_available(
+    mcp_servers: dict[str, Any] | None = None,
+    extra_allowed_tools: Sequence[str] | None = None,
+) -> bool:
+    """True if simple turns of a query with these tools may skip the SDK.
+
+    The Messages API call has no tools, so queries that bring MCP servers
+    or extra tools (e.g. memory) always go through the SDK. Also needs the
+    fast path enabled and an API key.
+    """
+    return (
+        not mcp_servers
+        and not extra_allowed_tools
+        and settings.fast_path_enabled
+        and bool(os.environ.get("ANTHROPIC_API_KEY"))
+    )
+
+
+def _fast_path_request(user_text: str, system_prompt: str) -> dict[str, Any]:
+    return {
+        "model": MODEL_TIERS["simple"],
+        "max_tokens": 512,
+        "system": _TOOL_SECTION_RE.sub("", system_prompt),
+        "messages": [{"role": "user", "content": user_text}],
+    }
+
+
+async def _simple_fast_path(user_text: str, system_prompt: str) -> str | None:
+    """Answer a simple turn straight from the Messages API.
+
+    Returns ``None`` if the request fails — the caller falls back to the SDK.
     """
-    if isinstance(exc, ExceptionGroup):
-        return all(_is_transport_cleanup_error(e) for e in exc.exceptions)
-    return isinstance(exc, CLIConnectionError) and "not ready for writing" in str(exc)
+    from anthropic import APIError
+
+    try:
+        response = await _get_http_client().messages.create(
+            **_fast_path_request(user_text, system_prompt)
+        )
+    except APIError as exc:
+        log("WARN", f"[agent] Fast path failed, falling back to SDK: {exc}")
+        return None
+
+    text = "".join(block.text for block in response.content if block.type == "text")
+    return text or None
 
 
 async def query_agent(
     user_text: str,
     system_prompt: str,
     mcp_servers: dict[str, Any] | None = None,
-    extra_allowed_tools: list[str] | None = None,
+    extra_allowed_tools: Sequence[str] | None = None,
 ) -> str:
-    """Send a one-shot query to Claude. Returns the full text response."""
-    options = create_options(system_prompt, mcp_servers, extra_allowed_tools)
-    response_parts: list[str] = []
+    """Send a one-shot query to Claude. Returns the full text response.
+
+    Simple turns without MCP servers or extra tools try the HTTP fast
+    path first.
+    """
+    tier = select_tier(user_text)
+    if tier == "simple" and fast_path_available(mcp_servers, extra_allowed_tools):
+        fast = await _simple_fast_path(user_text, system_prompt)
+        if fast is not None:
+            return fast
+
+    options = create_options(system_prompt, mcp_servers, extra_allowed_tools, tier=tier)
+    sdk = _lazy_sdk()
+    buf = io.StringIO()
 
     try:
-        async with ClaudeSDKClient(options=options) as client:
+        async with client_pool.acquire(options) as client:
             await client.query(user_text)
 
             async for message in client.receive_response():
-                if isinstance(message, AssistantMessage):
+                if isinstance(message, sdk.AssistantMessage):
                     for block in message.content:
-                        if isinstance(block, TextBlock):
-                            response_parts.append(block.text)
-                        elif isinstance(block, ToolUseBlock):
-                            response_parts.append(f"I'll use {block.name}")
+                        if isinstance(block, sdk.TextBlock):
+                            if buf.tell():
+                                buf.write("\n")
+                            buf.write(block.text)
+                        elif isinstance(block, sdk.ToolUseBlock):
+                            if buf.tell():
+                                buf.write("\n")
+                            buf.write(f"I'll use {block.name}")
 
-    except BaseException as exc:
-        if _is_transport_cleanup_error(exc) and response_parts:
-            pass  # Response already collected, transport cleanup race — safe to ignore
-        else:
-            raise
+    except* sdk.CLIConnectionError as eg:
+        # Swallow only the transport cleanup race, once a response is collected
+        if not (buf.tell() and _is_transport_cleanup_error(eg)):
+            _reraise(eg)
 
-    return "\n".join(response_parts)
+    return buf.getvalue()
 
 
 async def query_agent_interruptible(
@@ -130,54 +496,104 @@ async def query_agent_interruptible(
     system_prompt: str,
     interrupt: InterruptController,
     mcp_servers: dict[str, Any] | None = None,
-    extra_allowed_tools: list[str] | None = None,
+    extra_allowed_tools: Sequence[str] | None = None,
     surface: Any | None = None,
 ) -> tuple[str, bool]:
     """Send a query to Claude with poll-based interruption.
 
-    Checks interrupt.is_interrupted between each streaming message.
-    Returns (response_text, was_interrupted).
+    Checks the interrupt flag between each streaming message and block.
+    Simple turns without MCP servers or extra tools try the HTTP fast path
+    first. Returns (response_text, was_interrupted).
     """
-    options = create_options(system_prompt, mcp_servers, extra_allowed_tools)
-    response_parts: list[str] = []
+    is_interrupted = interrupt.is_set
+    tier = select_tier(user_text)
+    if tier == "simple" and fast_path_available(mcp_servers, extra_allowed_tools):
+        fast = await _simple_fast_path(user_text, system_prompt)
+        if fast is not None:
+            return fast, is_interrupted()
+
+    options = create_options(system_prompt, mcp_servers, extra_allowed_tools, tier=tier)
+    sdk = _lazy_sdk()
+    buf = io.StringIO()
     interrupted = False
 
+    def on_text(block: TextBlock) -> None:
+        if buf.tell():
+            buf.write("\n")
+        buf.write(block.text)
+
+    def on_tool_use(block: ToolUseBlock) -> None:
+        if log_enabled("INFO"):
+            log("INFO", f"[TOOL] invoking {block.name}", {"toolInput": block.input})
+        if block.name == "WebSearch" and surface:
+            surface.set_state("searching")
+
+    def on_tool_result(block: ToolResultBlock) -> None:
+        if log_enabled("INFO"):
+            log("INFO", f"[TOOL] tool result {block.content}", {})
+
+    handlers: dict[type, Callable[[Any], None]] = {
+        sdk.TextBlock: on_text,
+        sdk.ToolUseBlock: on_tool_use,
+        sdk.ToolResultBlock: on_tool_result,
+    }
+
     try:
-        async with ClaudeSDKClient(options=options) as client:
+        async with client_pool.acquire(options) as client:
             await client.query(user_text)
 
             async for message in client.receive_response():
-                if interrupt.is_interrupted:
+                if is_interrupted():
                     interrupted = True
                     break
 
-                if isinstance(message, AssistantMessage):
+                if type(message) is sdk.AssistantMessage:
                     for block in message.content:
-                        if isinstance(block, TextBlock):
-                            response_parts.append(block.text)
-                        elif isinstance(block, ToolUseBlock):
-                            (
-                                log(
-                                    "INFO",
-                                    f"[TOOL] invoking {block.name}",
-                                    {
-                                        "toolInput": block.input,
-                                    },
-                                ),
-                            )
-                            if block.name == "WebSearch":
-                                if surface:
-                                    surface.set_state("searching")
-                        elif isinstance(block, ToolResultBlock):
-                            log("INFO", f"[TOOL] tool result {block.content}", {})
+                        if is_interrupted():
+                            interrupted = True
+                            break
+                        handler = handlers.get(type(block))
+                        if handler is not None:
+                            handler(block)
+                    if interrupted:
+                        break
+
+    except* sdk.CLIConnectionError as eg:
+        # Swallow only the transport cleanup race, once a response is collected
+        if not (buf.tell() and _is_transport_cleanup_error(eg)):
+            _reraise(eg)
+
+    return buf.getvalue(), interrupted
+
+
+# Streaming token batching — see query_stream_agent_interruptible()
+_DELTA_FLUSH_CHARS = 32
+_DELTA_FLUSH_INTERVAL = 0.016  # seconds
+
 
-    except BaseException as exc:
-        if _is_transport_cleanup_error(exc) and response_parts:
-            pass  # Response already collected, transport cleanup race — safe to ignore
-        else:
-            raise
+def _text_delta(message: Any, stream_event: type) -> str | None:
+    """Return the token of a ``text_delta`` StreamEvent, or None for other frames."""
+    if type(message) is not stream_event:
+        return None
+    event_get = message.event.get
+    if event_get("type", "") != "content_block_delta":
+        return None
+    delta_get = event_get("delta", {}).get
+    if delta_get("type", "") != "text_delta":
+        return None
+    return delta_get("text", "")
 
-    return "\n".join(response_parts), interrupted
+
+def _on_stream_tool_use(block: ToolUseBlock) -> AgentStreamEvent:
+    if log_enabled("INFO"):
+        log("INFO", f"[TOOL] invoking {block.name}", {"toolInput": block.input})
+    return AgentStreamEvent(kind="tool_use", tool_name=block.name)
+
+
+def _on_stream_tool_result(block: ToolResultBlock) -> AgentStreamEvent:
+    if log_enabled("INFO"):
+        log("INFO", f"[TOOL] tool result {block.content}", {})
+    return AgentStreamEvent(kind="tool_result")
 
 
 async def query_stream_agent_interruptible(
@@ -185,7 +601,8 @@ async def query_stream_agent_interruptible(
     system_prompt: str,
     interrupt: InterruptController,
     mcp_servers: dict[str, Any] | None = None,
-    extra_allowed_tools: list[str] | None = None,
+    extra_allowed_tools: Sequence[str] | None = None,
+    stream_tokens: bool = True,
 ) -> AsyncGenerator[AgentStreamEvent, None]:
     """Async generator that yields per-token deltas from the Claude agent.
 
@@ -194,77 +611,146 @@ async def query_stream_agent_interruptible(
     objects containing raw Anthropic API events (``content_block_delta``
     with ``text_delta``).
 
+    With ``stream_tokens=False`` the SDK sends no per-token frames; one
+    ``text_delta`` is synthesized per ``TextBlock`` instead. Use it when
+    the consumer doesn't need sub-block granularity.
+
+    Tokens are coalesced into batches of ~``_DELTA_FLUSH_CHARS`` characters
+    or ``_DELTA_FLUSH_INTERVAL`` seconds, and flushed early whenever any
+    other frame arrives, so consumers see far fewer tiny events.
+
+    Simple turns without MCP servers or extra tools stream from the
+    Messages API directly when the fast path is available, falling back
+    to the SDK if that fails before any text arrived.
+
     Yields:
         AgentStreamEvent with kind in {text_delta, tool_use, tool_result, done}.
     """
+    is_interrupted = interrupt.is_set
+    tier = select_tier(user_text)
+    if tier == "simple" and fast_path_available(mcp_servers, extra_allowed_tools):
+        from anthropic import APIError
+
+        accumulated = io.StringIO()
+        interrupted = False
+        try:
+            async with _get_http_client().messages.stream(
+                **_fast_path_request(user_text, system_prompt)
+            ) as stream:
+                async for text in stream.text_stream:
+                    if is_interrupted():
+                        interrupted = True
+                        break
+                    if text:
+                        accumulated.write(text)
+                        yield AgentStreamEvent(kind="text_delta", text=text)
+        except APIError as exc:
+            if not accumulated.tell():
+                log("WARN", f"[agent] Fast path failed, falling back to SDK: {exc}")
+            else:
+                log("WARN", f"[agent] Fast path stream cut short: {exc}")
+        if accumulated.tell() or interrupted:
+            yield AgentStreamEvent(
+                kind="done",
+                full_response=accumulated.getvalue(),
+                was_interrupted=interrupted,
+            )
+            return
+
     options = create_options(
         system_prompt,
         mcp_servers,
         extra_allowed_tools,
-        include_partial_messages=True,
+        include_partial_messages=stream_tokens,
+        tier=tier,
     )
-    accumulated_text: list[str] = []
+    sdk = _lazy_sdk()
+    stream_event = sdk.StreamEvent
+    block_handlers = sdk.stream_block_handlers
+    loop = asyncio.get_running_loop()
+    accumulated = io.StringIO()
+    pending: list[str] = []
+    pending_chars = 0
+    last_flush = loop.time()
+    interrupted = False
 
     try:
-        async with ClaudeSDKClient(options=options) as client:
+        async with client_pool.acquire(options) as client:
             await client.query(user_text)
 
             async for message in client.receive_response():
-                if interrupt.is_interrupted:
-                    yield AgentStreamEvent(
-                        kind="done",
-                        full_response="".join(accumulated_text),
-                        was_interrupted=True,
-                    )
-                    return
-
-                # --- Raw streaming token from Anthropic API ---
-                if isinstance(message, StreamEvent):
-                    event = message.event
-                    event_type = event.get("type", "")
-                    if event_type == "content_block_delta":
-                        delta = event.get("delta", {})
-                        delta_type = delta.get("type", "")
-                        if delta_type == "text_delta":
-                            token = delta.get("text", "")
-                            if token:
-                                accumulated_text.append(token)
-                                yield AgentStreamEvent(kind="text_delta", text=token)
-                        elif delta_type == "thinking_delta":
-                            thinking = delta.get("thinking", "")
+                if is_interrupted():
+                    interrupted = True
+                    break
+
+                # --- Raw text token: batch before yielding ---
+                token = _text_delta(message, stream_event)
+                if token is not None:
+                    if token:
+                        accumulated.write(token)
+                        pending.append(token)
+                        pending_chars += len(token)
+                        now = loop.time()
+                        if (
+                            pending_chars >= _DELTA_FLUSH_CHARS
+                            or now - last_flush >= _DELTA_FLUSH_INTERVAL
+                        ):
+                            yield AgentStreamEvent(
+                                kind="text_delta", text="".join(pending)
+                            )
+                            pending.clear()
+                            pending_chars = 0
+                            last_flush = now
+                    continue
+
+                # Any other frame — flush batched text first to keep order
+                if pending:
+                    yield AgentStreamEvent(kind="text_delta", text="".join(pending))
+                    pending.clear()
+                    pending_chars = 0
+                    last_flush = loop.time()
+
+                # --- Raw thinking token from Anthropic API ---
+                message_type = type(message)
+                if message_type is stream_event:
+                    event_get = message.event.get
+                    if event_get("type", "") == "content_block_delta":
+                        delta_get = event_get("delta", {}).get
+                        if delta_get("type", "") == "thinking_delta":
+                            thinking = delta_get("thinking", "")
                             if thinking:
                                 yield AgentStreamEvent(
                                     kind="thinking_delta", thinking=thinking
                                 )
 
                 # --- Full message (tool use / tool result blocks) ---
-                elif isinstance(message, AssistantMessage):
+                elif message_type is sdk.AssistantMessage:
                     for block in message.content:
-                        if isinstance(block, ToolUseBlock):
-                            log(
-                                "INFO",
-                                f"[TOOL] invoking {block.name}",
-                                {"toolInput": block.input},
-                            )
-                            yield AgentStreamEvent(
-                                kind="tool_use", tool_name=block.name
-                            )
-                        elif isinstance(block, ToolResultBlock):
-                            log(
-                                "INFO",
-                                f"[TOOL] tool result {block.content}",
-                                {},
-                            )
-                            yield AgentStreamEvent(kind="tool_result")
-                        # TextBlock — skip, already covered by text_delta events
-
-    except BaseException as exc:
-        if _is_transport_cleanup_error(exc) and accumulated_text:
-            pass  # Response already collected, transport cleanup race — safe to ignore
-        else:
-            raise
+                        # Multi-block messages can be long — honour a
+                        # cancel without waiting for the next message.
+                        if is_interrupted():
+                            interrupted = True
+                            break
+                        if not stream_tokens and type(block) is sdk.TextBlock:
+                            accumulated.write(block.text)
+                            yield AgentStreamEvent(kind="text_delta", text=block.text)
+                            continue
+                        handler = block_handlers.get(type(block))
+                        if handler is not None:
+                            yield handler(block)
+                    if interrupted:
+                        break
+
+            if pending and not interrupted:
+                yield AgentStreamEvent(kind="text_delta", text="".join(pending))
+
+    except* sdk.CLIConnectionError as eg:
+        # Swallow only the transport cleanup race, once a response is collected
+        if not (accumulated.tell() and _is_transport_cleanup_error(eg)):
+            _reraise(eg)
 
     yield AgentStreamEvent(
         kind="done",
-        full_response="".join(accumulated_text),
+        full_response=accumulated.getvalue(),
+        was_interrupted=interrupted,
     )
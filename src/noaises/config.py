@@ -1,3 +1,4 @@
+from functools import cached_property
 from pathlib import Path
 
 from pydantic import Field
@@ -10,6 +11,12 @@ class Settings(BaseSettings):
         default=Path.home() / ".noaises", validation_alias="NOAISES_HOME"
     )
 
+    # Minimum console log level: INFO, WARN or ERROR
+    log_level: str = Field(default="INFO")
+
+    # Print full tracebacks for unexpected errors
+    debug: bool = Field(default=False)
+
     # Streaming mode (token-by-token output + streaming TTS)
     enable_streaming: bool = Field(default=True)
 
@@ -18,15 +25,21 @@ class Settings(BaseSettings):
     memory_distill_interval: int = Field(default=5)  # every N turns
     memory_distill_model: str = Field(default="claude-haiku-4-5-20251001")
 
+    # Simple-turn fast path (direct Messages API, bypasses the CLI subprocess)
+    fast_path_enabled: bool = Field(default=True)
+
     # Camera / Vision
     camera_device_index: int = Field(default=0)
     camera_frame_interval: float = Field(default=0.5)
     vision_model_name: str = Field(default="vikhyatk/moondream2")
     vision_preload: bool = Field(default=True)
 
-    @property
+    @cached_property
     def noaises_home_resolved(self) -> Path:
-        """Resolve noaises_home, expanding ~ to user home directory."""
+        """Resolve noaises_home, expanding ~ to user home directory.
+
+        Invariant for the process lifetime, so it's resolved once.
+        """
         return self.noaises_home.expanduser()
 
 
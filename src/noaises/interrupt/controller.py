@@ -1,14 +1,14 @@
 """Interrupt controller — thread-safe barge-in and stop support.
 
-Uses both threading.Event (for cross-thread polling from blocking
+Uses a plain bool flag (for cross-thread polling from blocking
 sounddevice/TTS threads) and asyncio.Event (for async coroutine waiting).
+A single attribute store is atomic in CPython, so the flag needs no lock.
 """
 
 from __future__ import annotations
 
 import asyncio
 import enum
-import threading
 
 
 class InterruptSource(enum.Enum):
@@ -19,20 +19,24 @@ class InterruptController:
     """Central coordinator for interrupt signals across threads.
 
     fire() is thread-safe — can be called from any thread (pywebview,
-    sounddevice, etc.). is_interrupted is a cheap poll for blocking code.
-    wait() is for async coroutines.
+    sounddevice, etc.). is_interrupted is a cheap poll for blocking code;
+    tight loops should call is_set() instead. wait() is for async coroutines.
     """
 
     def __init__(self, loop: asyncio.AbstractEventLoop):
         self._loop = loop
-        self._thread_event = threading.Event()
+        self._flag = False
         self._async_event = asyncio.Event()
         self._source: InterruptSource | None = None
         self._enabled = False
 
     @property
     def is_interrupted(self) -> bool:
-        return self._thread_event.is_set()
+        return self._flag
+
+    def is_set(self) -> bool:
+        """Same as ``is_interrupted`` — for hot pollers to bind once and call."""
+        return self._flag
 
     @property
     def source(self) -> InterruptSource | None:
@@ -40,7 +44,7 @@ class InterruptController:
 
     def enable(self) -> None:
         """Enable interrupt detection. Clears any prior signal."""
-        self._thread_event.clear()
+        self._flag = False
         self._async_event.clear()
         self._source = None
         self._enabled = True
@@ -50,11 +54,15 @@ class InterruptController:
         self._enabled = False
 
     def fire(self, source: InterruptSource) -> None:
-        """Signal an interrupt. Thread-safe — callable from any thread."""
-        if not self._enabled:
+        """Signal an interrupt. Thread-safe — callable from any thread.
+
+        Repeat signals within one interruption are no-ops: the first source
+        wins and the loop is only woken once.
+        """
+        if not self._enabled or self._flag:
             return
         self._source = source
-        self._thread_event.set()
+        self._flag = True
         self._loop.call_soon_threadsafe(self._async_event.set)
 
     async def wait(self) -> InterruptSource:
@@ -3,8 +3,26 @@ import sys
 from datetime import datetime
 from typing import Any, Literal
 
+from .config import settings
+
 LogLevel = Literal["INFO", "WARN", "ERROR"]
 
+_LEVELS: dict[str, int] = {"INFO": 20, "WARN": 30, "ERROR": 40}
+_min_level = _LEVELS.get(settings.log_level.upper(), _LEVELS["INFO"])
+_now = datetime.now
+
+# Encoding per console stream for the UnicodeEncodeError fallback. Keyed by
+# the stream object itself, so a swapped sys.stdout gets its own entry.
+_stream_encodings: dict[Any, str] = {}
+
+
+def log_enabled(level: LogLevel) -> bool:
+    """Return True if messages at *level* pass the configured log level.
+
+    Use it to skip building expensive messages that would be dropped.
+    """
+    return _LEVELS[level] >= _min_level
+
 
 def log(level: LogLevel, message: str, data: dict[str, Any] | None = None) -> None:
     """Log a message with optional structured data.
@@ -14,8 +32,8 @@ def log(level: LogLevel, message: str, data: dict[str, Any] | None = None) -> No
         message: Log message
         data: Optional structured data to include
     """
-    timestamp = datetime.now().isoformat()
-    log_message = f"[{timestamp}] [{level}] {message}"
+    if _LEVELS[level] < _min_level:
+        return
 
     # Format data as JSON if present
     data_str = ""
@@ -25,15 +43,18 @@ def log(level: LogLevel, message: str, data: dict[str, Any] | None = None) -> No
         except (TypeError, ValueError):
             data_str = f" {data}"
 
-    output = log_message + data_str
+    output = f"[{_now().isoformat()}] [{level}] {message}{data_str}\n"
 
+    # Looked up per call — stdout/stderr may be swapped after import
     stream = sys.stderr if level in ("ERROR", "WARN") else sys.stdout
     try:
-        print(output, file=stream)
+        stream.write(output)
     except UnicodeEncodeError:
         # Windows cp1252 console can't encode some Unicode characters
-        encoding = getattr(stream, "encoding", "utf-8") or "utf-8"
-        safe = output.encode(encoding, errors="replace").decode(
-            encoding, errors="replace"
+        encoding = _stream_encodings.get(stream)
+        if encoding is None:
+            encoding = getattr(stream, "encoding", "utf-8") or "utf-8"
+            _stream_encodings[stream] = encoding
+        stream.write(
+            output.encode(encoding, errors="replace").decode(encoding, errors="replace")
         )
-        print(safe, file=stream)
@@ -7,24 +7,33 @@ If no surface is available, asyncio runs on the main thread as normal.
 
 Shutdown flow:
 - Ctrl+C in console -> async loop exits -> surface.destroy() kills webview -> process exits
-- User closes webview window -> on_closed fires -> os._exit() kills everything
+- User closes webview window -> on_closed sets the shutdown event -> the loop
+  task is cancelled, its finally block saves state and exits; os._exit() only
+  if that takes longer than _SHUTDOWN_TIMEOUT
 """
 
 from __future__ import annotations
 
 import asyncio
 import os
+import sys
 import threading
+import time
+import traceback
+from contextlib import aclosing
 from pathlib import Path
 
-from dotenv import load_dotenv
-
 from noaises.agent.core import (
+    client_pool,
+    create_options,
+    fast_path_available,
     query_agent_interruptible,
     query_stream_agent_interruptible,
 )
 from noaises.interrupt.controller import InterruptController
-from noaises.memory.distiller import distill_memories, should_distill
+from noaises.logger import log
+from noaises.memory.distiller import aclose_client, distill_memories, should_distill
+from noaises.memory.model import FullMemoryContext
 from noaises.personality.distiller import distill_personality
 from noaises.memory.store import MemoryStore
 from noaises.memory.tools import (
@@ -55,23 +64,164 @@ SESSIONS_DIR = HOME_DIR / "sessions"
 PERSONALITY_DIR = HOME_DIR / "personality"
 ARTIFACTS_DIR = HOME_DIR / "artifacts"
 
+# Max seconds to wait for a clean shutdown after the window is closed
+_SHUTDOWN_TIMEOUT = 10.0
+
+# Hot-path asyncio helper, bound once
+_get_running_loop = asyncio.get_running_loop
+
+# Tool guidance appended to every system prompt
+_MEMORY_GUIDANCE = MEMORY_META_PROMPT + "\n" + CAMERA_META_PROMPT
+
+# MCP tools the agent may call on top of core.ALLOWED_TOOLS
+_EXTRA_ALLOWED_TOOLS = (*MEMORY_TOOL_NAMES, *CAMERA_TOOL_NAMES)
+
+# Surface state shown while the agent runs a tool (default: "thinking")
+_TOOL_TO_STATE: dict[str, str] = {
+    "WebSearch": "searching",
+    **dict.fromkeys(CAMERA_TOOL_NAMES, "seeing"),
+    **dict.fromkeys(MEMORY_TOOL_NAMES, "remembering"),
+}
+
+
+async def _to_thread_fast(func, *args):
+    """Run a blocking call on the default executor.
+
+    Like ``asyncio.to_thread`` minus the contextvars copy and ``partial``
+    wrapper — nothing on the per-turn path relies on context variables.
+    """
+    return await _get_running_loop().run_in_executor(None, func, *args)
+
+
+class _TokenWriter:
+    """Typewriter console output that flushes stdout in small batches.
+
+    Flushing per token costs a write syscall each; batching every
+    ``max_chars`` characters or ``interval`` seconds still reads as live.
+    On POSIX, batches go straight to the stdout fd with ``os.write``,
+    skipping the TextIOWrapper stack; elsewhere (Windows consoles, or a
+    stdout without a real fd) they go through ``sys.stdout``. Before each
+    raw write ``sys.stdout`` is flushed, so ``print``/``log()`` lines from
+    the turn keep their place when stdout is a pipe (a no-op when empty).
+    """
+
+    def __init__(self, max_chars: int = 64, interval: float = 0.03):
+        self._buf: list[str] = []
+        self._chars = 0
+        self._max_chars = max_chars
+        self._interval = interval
+        self._last_flush = time.monotonic()
+
+        self._fd: int | None = None
+        self._encoding = sys.stdout.encoding or "utf-8"
+        if os.name == "posix":
+            try:
+                self._fd = sys.stdout.fileno()
+            except (AttributeError, OSError, ValueError):
+                pass  # e.g. captured stdout — keep the text-stream path
+
+    def write(self, text: str) -> None:
+        self._buf.append(text)
+        self._chars += len(text)
+        now = time.monotonic()
+        if self._chars >= self._max_chars or now - self._last_flush >= self._interval:
+            self.flush(now)
+
+    def flush(self, now: float | None = None) -> None:
+        if self._buf:
+            text = "".join(self._buf)
+            self._buf.clear()
+            self._chars = 0
+            if self._fd is not None:
+                # Anything buffered in sys.stdout must land before our bytes
+                sys.stdout.flush()
+                data = text.encode(self._encoding, errors="replace")
+                while data:
+                    data = data[os.write(self._fd, data) :]
+            else:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+        self._last_flush = time.monotonic() if now is None else now
+
+
+class _ConsoleReader:
+    """Reads console input on one long-lived daemon thread.
+
+    Replaces a per-turn ``to_thread(input)`` hop. The thread only prompts
+    when :meth:`readline` asks for a line, so "You: " never lands in the
+    middle of a streamed reply.
+    """
+
+    def __init__(self, prompt: str = "You: "):
+        self._prompt = prompt
+        self._loop = asyncio.get_running_loop()
+        self._lines: asyncio.Queue[str | BaseException] = asyncio.Queue(maxsize=1)
+        self._wanted = threading.Semaphore(0)
+        threading.Thread(target=self._run, name="noaises-console", daemon=True).start()
+
+    def _run(self) -> None:
+        while True:
+            self._wanted.acquire()
+            try:
+                line: str | BaseException = input(self._prompt)
+            except (EOFError, KeyboardInterrupt) as e:
+                line = e
+            try:
+                self._loop.call_soon_threadsafe(self._lines.put_nowait, line)
+            except RuntimeError:
+                return  # loop closed during shutdown
+            if isinstance(line, BaseException):
+                return
+
+    async def readline(self) -> str:
+        """Prompt for and return the next line; re-raises EOF/Ctrl+C."""
+        self._wanted.release()
+        line = await self._lines.get()
+        if isinstance(line, BaseException):
+            raise line
+        return line
+
+
+async def _distill_worker(
+    queue: asyncio.Queue[int],
+    personality: PersonalityEngine,
+    full_memory: FullMemoryContext,
+    session: SessionEngine,
+    memory_store: MemoryStore,
+) -> None:
+    """Run queued distillation jobs one at a time.
+
+    Memory then personality, sequentially — so the two never write to
+    the memory store concurrently and slow runs can't pile up tasks. A
+    failed job is logged and skipped; the worker keeps serving the queue.
+    """
+    while True:
+        await queue.get()
+        try:
+            await distill_memories(full_memory, session, memory_store)
+            await distill_personality(personality, full_memory, session, memory_store)
+        except Exception as e:  # noqa: BLE001 — one bad job must not stop the worker
+            if settings.debug:
+                traceback.print_exc()
+            log("ERROR", f"[distill] Distillation failed: {e!r}")
+        finally:
+            queue.task_done()
+
 
 def _init_voice():
     """Try to initialize the voice pipeline. Returns VoicePipeline or None."""
     speech_key = os.environ.get("AZURE_SPEECH_KEY")
     speech_region = os.environ.get("AZURE_SPEECH_REGION")
     speech_voice = os.environ.get("AZURE_SPEECH_VOICE")
+    # Checked before importing — Whisper and the Speech SDK are slow to load
+    if not speech_key or not speech_region:
+        print("[voice] AZURE_SPEECH_KEY / AZURE_SPEECH_REGION not set — TTS disabled.")
+        return None
     try:
         from noaises.voice.stt import WhisperSTT
         from noaises.voice.tts import AzureTTS
         from noaises.voice.pipeline import VoicePipeline
 
-        if not speech_key or not speech_region:
-            print(
-                "[voice] AZURE_SPEECH_KEY / AZURE_SPEECH_REGION not set — TTS disabled."
-            )
-            return None
-
         stt = WhisperSTT(model_size="base")
         tts = AzureTTS(speech_key=speech_key, region=speech_region)
         print("[voice] Voice pipeline initialized (Whisper STT + Azure TTS).")
@@ -92,43 +242,102 @@ def _init_surface():
         return None
 
 
-async def async_main(surface=None):
-    """Run the companion loop. Called from the asyncio event loop."""
+async def async_main(
+    vision_pipeline: VisionPipeline,
+    surface=None,
+    shutdown_evt: threading.Event | None = None,
+):
+    """Run the companion loop. Called from the asyncio event loop.
+
+    *vision_pipeline* is built (and optionally preloaded) by ``main()``
+    before the loop starts, so the model load happens exactly once.
+    Setting *shutdown_evt* (from any thread) cancels the loop so the
+    ``finally`` cleanup still runs.
+    """
     loop = asyncio.get_running_loop()
     interrupt = InterruptController(loop)
 
-    # Initialize core modules
+    if shutdown_evt is not None:
+        main_task = asyncio.current_task()
+
+        async def _watch_shutdown() -> None:
+            await _to_thread_fast(shutdown_evt.wait)
+            main_task.cancel()
+
+        asyncio.create_task(_watch_shutdown())
+
+    # Initialize core modules. The disk-bound loads (memory snapshots +
+    # journal, personality TOML + evolution, the Whisper model) are
+    # independent, so they run side by side on worker threads.
     memory_store = MemoryStore(MEMORY_DIR)
-    full_memory = memory_store.load_full_memory()
+    full_memory, personality, voice = await asyncio.gather(
+        asyncio.to_thread(memory_store.load_full_memory),
+        asyncio.to_thread(
+            PersonalityEngine, CONFIG_DIR / "personality.toml", PERSONALITY_DIR
+        ),
+        asyncio.to_thread(_init_voice),
+    )
+    # Compress old short-term days off the startup path (after the load,
+    # which may first fold journaled ops into an older day's file)
+    archive_task = asyncio.create_task(asyncio.to_thread(memory_store.archive_old))
     session = SessionEngine(SESSIONS_DIR)
-    personality = PersonalityEngine(CONFIG_DIR / "personality.toml", PERSONALITY_DIR)
     screen_capture = CaptureScreenTool(ARTIFACTS_DIR / "screenshots")
-    vision_pipeline = VisionPipeline(
-        settings.camera_device_index,
-        settings.camera_frame_interval,
-        settings.vision_model_name,
-    )
+    # Settings are fixed for the session — read once, not per turn
+    enable_streaming = settings.enable_streaming
+
+    # MCP servers are built once — their tools close over full_memory and
+    # vision_pipeline, which stay the same objects for the whole session.
+    mcp_servers = {
+        "memory": create_memory_mcp_server(full_memory),
+        "camera": create_camera_mcp_server(vision_pipeline),
+    }
+
+    def build_system_prompt(session_summary: str) -> str:
+        return personality.build_system_prompt(
+            memory_store.build_memory_state(full_memory),
+            session_summary,
+            memory_guidance=_MEMORY_GUIDANCE,
+        )
 
-    # Optionally pre-load vision model so camera_on is instant
-    if settings.vision_preload:
-        print("[vision] Pre-loading vision model...")
-        await asyncio.to_thread(vision_pipeline._model.load)
-        print("[vision] Vision model ready.")
-    else:
-        print("[vision] Vision model will load on first camera use (~80s).")
+    # Turns that may go to the HTTP fast path never acquire a pooled
+    # client, so booting one for them would be wasted
+    prewarm_clients = not fast_path_available(mcp_servers, _EXTRA_ALLOWED_TOOLS)
 
-    # Initialize optional voice
-    voice = _init_voice()
+    # Background distillation — one worker, small bounded backlog
+    distill_queue: asyncio.Queue[int] = asyncio.Queue(maxsize=4)
+    distill_task = asyncio.create_task(
+        _distill_worker(distill_queue, personality, full_memory, session, memory_store)
+    )
+
+    # Console input when voice isn't available
+    console = None if voice else _ConsoleReader()
 
     turn_count = 0
 
-    mode = "voice" if voice else "text"
-    print(
-        f"{personality.name} is awake ({mode} mode). {'Speak' if voice else 'Type a message'} (Ctrl+C to quit).\n"
+    mode, verb = ("voice", "Speak") if voice else ("text", "Type a message")
+    sys.stdout.write(
+        f"{personality.name} is awake ({mode} mode). {verb} (Ctrl+C to quit).\n\n"
     )
 
     try:
         while True:
+            # ── Prepare the turn (overlaps with the user speaking) ──
+            # The summary is read before the user's message is logged, so
+            # it covers the earlier exchanges only; the message itself
+            # reaches the agent as the query. Reading it now fixes the
+            # system prompt up front, so the agent CLI for it can boot in
+            # the background meanwhile.
+            session_summary = await _to_thread_fast(session.get_today_summary)
+            if prewarm_clients:
+                client_pool.prewarm(
+                    create_options(
+                        build_system_prompt(session_summary),
+                        mcp_servers,
+                        _EXTRA_ALLOWED_TOOLS,
+                        include_partial_messages=enable_streaming,
+                    )
+                )
+
             # ── Listening (not interruptible) ──
             interrupt.disable()
             if surface:
@@ -140,22 +349,21 @@ async def async_main(surface=None):
                     continue
                 print(f"You: {user_input}")
             else:
-                user_input = await asyncio.to_thread(input, "You: ")
+                user_input = await console.readline()
                 if not user_input.strip():
                     continue
 
             # Store user message
-            session.append("user", user_input)
+            await session.append_async("user", user_input)
 
             # -- Vision: flush buffered frames if camera is active --
             vision_context = ""
-            if vision_pipeline.is_active:
-                frame_count = vision_pipeline.pending_frame_count
-                if frame_count > 0:
-                    print(f"[vision] Processing {frame_count} frames...")
-                    if surface:
-                        surface.set_state("seeing")
-                description = await vision_pipeline.flush_and_describe()
+            frames = vision_pipeline.flush_frames()
+            if frames:
+                print(f"[vision] Processing {len(frames)} frames...")
+                if surface:
+                    surface.set_state("seeing")
+                description = await vision_pipeline.describe(frames)
                 if description:
                     print(f"[vision] Done: {description[:150]}[TRUNCATED]")
                     vision_context = (
@@ -167,14 +375,14 @@ async def async_main(surface=None):
             if CaptureScreenTool.detect_intent(user_input):
                 if surface:
                     surface.set_state("searching")
-                screenshot_path = await asyncio.to_thread(
-                    screen_capture.capture, surface
-                )
+                screenshot_path = await _to_thread_fast(screen_capture.capture, surface)
                 screenshot_context = (
                     f"\n\n[A screenshot of the user's current screen has been saved. "
                     f"Use the Read tool to view it at: {screenshot_path}]"
                 )
 
+            prompt = f"{user_input}{vision_context}{screenshot_context}"
+
             # ── Thinking (interruptible via poll) ──
             interrupt.enable()
             if surface:
@@ -182,93 +390,73 @@ async def async_main(surface=None):
 
             turn_count += 1
 
-            # Rebuild MCP servers each turn
-            memory_server = create_memory_mcp_server(full_memory)
-            camera_server = create_camera_mcp_server(vision_pipeline)
-            mcp_servers = {"memory": memory_server, "camera": camera_server}
-
-            # Build system prompt with memory state + guidance
-            memory_state = memory_store.build_memory_state(full_memory)
-            session_summary = session.get_today_summary()
-            system_prompt = personality.build_system_prompt(
-                memory_state,
-                session_summary,
-                memory_guidance=MEMORY_META_PROMPT + "\n" + CAMERA_META_PROMPT,
-            )
-
-            if settings.enable_streaming:
-                # ── Streaming path (token-by-token) ──
-                agent_stream = query_stream_agent_interruptible(
-                    user_input + vision_context + screenshot_context,
-                    system_prompt,
-                    interrupt,
-                    mcp_servers=mcp_servers,
-                    extra_allowed_tools=MEMORY_TOOL_NAMES + CAMERA_TOOL_NAMES,
-                )
+            # Rebuilt in case a background distillation changed memory or
+            # personality since the spare client was started; unchanged, it
+            # matches the pre-warmed client
+            system_prompt = build_system_prompt(session_summary)
 
-                if voice:
-                    response, was_interrupted = await voice.speak_streaming(
-                        agent_stream,
+            if enable_streaming:
+                # ── Streaming path (token-by-token) ──
+                # Closed as soon as the consumer stops early (barge-in,
+                # interrupt), so the turn's client disconnects right away
+                async with aclosing(
+                    query_stream_agent_interruptible(
+                        prompt,
+                        system_prompt,
                         interrupt,
-                        surface=surface,
-                        personality_name=personality.name,
+                        mcp_servers=mcp_servers,
+                        extra_allowed_tools=_EXTRA_ALLOWED_TOOLS,
                     )
-                else:
-                    response = ""
-                    was_interrupted = False
-                    first_token = True
-                    in_thinking = False
-                    async for event in agent_stream:
-                        if event.kind == "thinking_delta":
-                            if not in_thinking:
-                                in_thinking = True
-                                print("\n  [thinking] ", end="", flush=True)
-                            print(event.thinking, end="", flush=True)
-                        elif event.kind == "text_delta":
-                            if in_thinking:
-                                in_thinking = False
-                                print()  # end thinking line
-                            if first_token:
-                                first_token = False
-                                print(
-                                    f"\n{personality.name}: ",
-                                    end="",
-                                    flush=True,
-                                )
-                            print(event.text, end="", flush=True)
-                        elif event.kind == "tool_use":
-                            if surface:
-                                if event.tool_name == "WebSearch":
-                                    state = "searching"
-                                elif event.tool_name in (
-                                    "mcp__camera__camera_on",
-                                    "mcp__camera__camera_off",
-                                ):
-                                    state = "seeing"
-                                elif event.tool_name in (
-                                    "mcp__memory__memory_store",
-                                    "mcp__memory__memory_remove",
-                                ):
-                                    state = "remembering"
-                                else:
-                                    state = "thinking"
-                                surface.set_state(state)
-                        elif event.kind == "tool_result":
-                            if surface and not first_token:
-                                surface.set_state("speaking")
-                        elif event.kind == "done":
-                            response = event.full_response
-                            was_interrupted = event.was_interrupted
-                            break
-                    print()  # newline after typewriter output
+                ) as agent_stream:
+                    if voice:
+                        response, was_interrupted = await voice.speak_streaming(
+                            agent_stream,
+                            interrupt,
+                            surface=surface,
+                            personality_name=personality.name,
+                        )
+                    else:
+                        response = ""
+                        was_interrupted = False
+                        first_token = True
+                        in_thinking = False
+                        out = _TokenWriter()
+                        async for event in agent_stream:
+                            if event.kind == "thinking_delta":
+                                if not in_thinking:
+                                    in_thinking = True
+                                    out.write("\n  [thinking] ")
+                                out.write(event.thinking)
+                            elif event.kind == "text_delta":
+                                if in_thinking:
+                                    in_thinking = False
+                                    out.write("\n")  # end thinking line
+                                if first_token:
+                                    first_token = False
+                                    out.write(f"\n{personality.name}: ")
+                                out.write(event.text)
+                            elif event.kind == "tool_use":
+                                if surface:
+                                    surface.set_state(
+                                        _TOOL_TO_STATE.get(event.tool_name, "thinking")
+                                    )
+                            elif event.kind == "tool_result":
+                                if surface and not first_token:
+                                    surface.set_state("speaking")
+                            elif event.kind == "done":
+                                response = event.full_response
+                                was_interrupted = event.was_interrupted
+                                break
+                        out.write("\n")  # newline after typewriter output
+                        out.flush()
             else:
                 # ── Non-streaming path (full response at once) ──
                 response, was_interrupted = await query_agent_interruptible(
-                    user_input + vision_context + screenshot_context,
+                    prompt,
                     system_prompt,
                     interrupt,
                     mcp_servers=mcp_servers,
-                    extra_allowed_tools=MEMORY_TOOL_NAMES + CAMERA_TOOL_NAMES,
+                    extra_allowed_tools=_EXTRA_ALLOWED_TOOLS,
                     surface=surface,
                 )
                 if not was_interrupted:
@@ -276,13 +464,14 @@ async def async_main(surface=None):
 
             interrupt.disable()
 
-            # Save memory after each turn (agent may have called memory tools)
-            memory_store.save_all(full_memory)
+            # Save memory after each turn (agent may have called memory tools);
+            # debounced, so it doesn't hold up the next prompt
+            memory_store.schedule_save(full_memory)
 
             if was_interrupted:
                 if response:
-                    session.append("assistant", response)
-                    session.append(
+                    await session.append_async("assistant", response)
+                    await session.append_async(
                         "system",
                         "[User interrupted before full response was heard]",
                     )
@@ -291,52 +480,60 @@ async def async_main(surface=None):
                 continue
 
             # ── Speaking (non-streaming voice path) ──
-            if not settings.enable_streaming and voice:
+            if not enable_streaming and voice:
                 if surface:
                     surface.set_state("speaking")
                 interrupt.enable()
                 await voice.speak_interruptible(response, interrupt)
                 if interrupt.is_interrupted:
-                    session.append(
+                    await session.append_async(
                         "system",
                         "[User interrupted before full response was heard]",
                     )
                 interrupt.disable()
 
             # ── Post-response bookkeeping ──
-            session.append("assistant", response)
+            await session.append_async("assistant", response)
             personality.record_interaction()
 
             if surface:
                 surface.set_state("idle")
 
-            # Distill every N turns (fire-and-forget)
+            # Distill every N turns (queued for the background worker)
             if should_distill(turn_count):
-                asyncio.create_task(
-                    distill_memories(full_memory, session, memory_store)
-                )
-                asyncio.create_task(
-                    distill_personality(personality, full_memory, session, memory_store)
-                )
+                try:
+                    distill_queue.put_nowait(turn_count)
+                except asyncio.QueueFull:
+                    print("[distill] Backlog full — skipping this distillation.")
 
     except (KeyboardInterrupt, EOFError):
         print(f"\n{personality.name} is going to sleep. Goodbye!")
     except Exception as e:
-        import traceback
-
-        print(f"\n[error] Unexpected error: {e}")
-        traceback.print_exc()
+        if settings.debug:
+            print(f"\n[error] Unexpected error: {e}")
+            traceback.print_exc()
+        else:
+            log("ERROR", f"Unexpected error: {e!r}")
     finally:
         # Stop all blocking voice operations so threads can exit
         if voice:
             voice.shutdown()
         vision_pipeline.shutdown()
 
-        # Save memory on exit
-        memory_store.save_all(full_memory)
+        distill_task.cancel()
+        archive_task.cancel()
+
+        # Close agent clients (terminates their CLI subprocesses)
+        await client_pool.close()
+        await aclose_client()
+
+        # Save memory on exit (supersedes any pending debounced save)
+        await memory_store.flush(full_memory)
+        await memory_store.close()
+        session.close()
 
-        # Play sleep animation, then close
-        if surface:
+        # Play sleep animation, then close (unless the window is already gone)
+        if surface and not (shutdown_evt and shutdown_evt.is_set()):
             surface.set_state("sleeping")
             try:
                 await asyncio.sleep(3)  # let the zzz animation play
@@ -349,34 +546,66 @@ async def async_main(surface=None):
         os._exit(0)
 
 
-def _run_async_loop(surface):
-    """Entry for the background thread — creates and runs the asyncio loop."""
-    asyncio.run(async_main(surface))
+def _init_vision() -> VisionPipeline:
+    """Create the vision pipeline; not loaded yet (see ``_run_async_loop``)."""
+    return VisionPipeline(
+        settings.camera_device_index,
+        settings.camera_frame_interval,
+        settings.vision_model_name,
+    )
+
+
+def _run_async_loop(
+    vision_pipeline: VisionPipeline,
+    surface=None,
+    shutdown_evt: threading.Event | None = None,
+):
+    """Preload the vision model if enabled, then run the asyncio loop.
+
+    Runs on the background thread when there's a surface (so the window
+    isn't held up by the load), otherwise on the main thread.
+    """
+    if settings.vision_preload:
+        print("[vision] Pre-loading vision model...")
+        vision_pipeline.preload()
+        print("[vision] Vision model ready.")
+    else:
+        print("[vision] Vision model will load on first camera use (~80s).")
+    asyncio.run(async_main(vision_pipeline, surface, shutdown_evt))
 
 
 def main():
+    from dotenv import load_dotenv
+
     load_dotenv(BASE_DIR / ".env")
 
     surface = _init_surface()
+    vision_pipeline = _init_vision()
 
     if surface:
         # Async loop in background thread, webview on main thread
+        shutdown_evt = threading.Event()
         loop_thread = threading.Thread(
-            target=_run_async_loop, args=(surface,), daemon=True
+            target=_run_async_loop,
+            args=(vision_pipeline, surface, shutdown_evt),
+            daemon=True,
         )
         loop_thread.start()
         print("[surface] Desktop persona launched.")
 
         def _on_window_closed():
-            # Window closed by user — force exit the whole process.
-            # The daemon thread will die automatically.
+            # Window closed by user — let async_main's finally block save
+            # memory and close clients (it exits the process itself), and
+            # only force-exit if that hangs.
             print("\nnoaises is going to sleep. Goodbye!")
+            shutdown_evt.set()
+            loop_thread.join(timeout=_SHUTDOWN_TIMEOUT)
             os._exit(0)
 
         surface.run_blocking(on_closed=_on_window_closed)  # blocks main thread
     else:
         # No surface — asyncio gets the main thread
-        asyncio.run(async_main())
+        _run_async_loop(vision_pipeline)
 
 
 if __name__ == "__main__":
@@ -1,20 +1,26 @@
 """Deterministic memory distiller — extracts semantic facts every N turns.
 
-Runs in the background via ``asyncio.create_task``. Uses Haiku (fast, cheap)
-to parse recent session history and emit structured memory operations.
+Runs in the background on ``main.py``'s distill worker. Uses Haiku (fast,
+cheap) to parse recent session history and emit structured memory operations.
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
+import re
+from collections import defaultdict
+from typing import TYPE_CHECKING
 
-import anthropic
+from pydantic import TypeAdapter, ValidationError
 
 from noaises.config import settings
-from noaises.memory.model import FullMemoryContext
+from noaises.memory.model import FullMemoryContext, MemoryOp
 from noaises.memory.store import MemoryStore
 from noaises.sessions.engine import SessionEngine
 
+if TYPE_CHECKING:
+    import anthropic
+
 DISTILLATION_SYSTEM_PROMPT = """\
 You are a memory extraction assistant. Given a recent conversation between a user \
 and their AI companion, plus the current memory state, extract semantic facts.
@@ -37,6 +43,35 @@ Rules:
 - Output ONLY the JSON array, no markdown fences, no commentary.
 """
 
+# Opening fence (with optional language tag) or closing fence, in one pass
+_FENCE_STRIP = re.compile(r"\A```[a-zA-Z0-9]*[ \t]*\n?|\n?```\s*\Z")
+
+# Parses and validates the whole response in one pass
+_OPS_ADAPTER = TypeAdapter(list[MemoryOp])
+
+
+# Reused across distill cycles (memory and personality) so the HTTP
+# connection pool stays warm
+_client: anthropic.AsyncAnthropic | None = None
+
+
+def get_client() -> anthropic.AsyncAnthropic:
+    """Return the shared Anthropic client, creating it on first use."""
+    global _client
+    if _client is None:
+        import anthropic  # deferred: pulls in httpx, only needed once distilling
+
+        _client = anthropic.AsyncAnthropic()
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the pooled Anthropic client, if one was created."""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.close()
+
 
 def should_distill(turn_count: int) -> bool:
     """Check whether distillation should run for the current turn."""
@@ -50,20 +85,19 @@ async def distill_memories(
     session: SessionEngine,
     store: MemoryStore,
 ) -> None:
-    """Run background memory distillation (fire-and-forget with asyncio.create_task)."""
+    """Run background memory distillation (errors are reported, never raised)."""
     try:
-        # 1. Load recent session entries
-        entries = session.get_today()
+        # 1. Load recent session entries (off the loop — reads the whole log)
+        entries = await asyncio.to_thread(session.get_today)
         if not entries:
             return
         recent = entries[-20:]
 
         # 2. Build transcript
-        transcript_lines: list[str] = []
-        for entry in recent:
-            role = "User" if entry["sender"] == "user" else "Assistant"
-            transcript_lines.append(f"{role}: {entry['text']}")
-        transcript = "\n\n".join(transcript_lines)
+        transcript = "\n\n".join(
+            f"{'User' if e['sender'] == 'user' else 'Assistant'}: {e['text']}"
+            for e in recent
+        )
 
         # 3. Build current memory state
         current_state = store.build_memory_state(full_memory)
@@ -74,8 +108,7 @@ async def distill_memories(
         )
 
         # 4. Call Haiku for extraction
-        client = anthropic.AsyncAnthropic()
-        response = await client.messages.create(
+        response = await get_client().messages.create(
             model=settings.memory_distill_model,
             max_tokens=1024,
             system=DISTILLATION_SYSTEM_PROMPT,
@@ -85,43 +118,35 @@ async def distill_memories(
         raw_text = response.content[0].text.strip()
 
         # 5. Strip markdown code fences if present
-        if raw_text.startswith("```"):
-            first_newline = raw_text.index("\n") if "\n" in raw_text else len(raw_text)
-            raw_text = raw_text[first_newline + 1 :]
-            if raw_text.endswith("```"):
-                raw_text = raw_text[:-3].rstrip()
+        raw_text = _FENCE_STRIP.sub("", raw_text).strip()
 
         # 6. Parse and apply operations
-        operations = json.loads(raw_text)
-        applied = 0
+        operations = _OPS_ADAPTER.validate_json(raw_text)
+        # Group by (tier, category) so each category is rebuilt only once
+        by_category: defaultdict[tuple[str, str], list[tuple[str, str]]] = defaultdict(
+            list
+        )
         for op in operations:
-            tier = op.get("tier")
-            category = op.get("category")
-            content = op.get("content")
-            action = op.get("action", "add")
-
-            if not tier or not category or not content:
-                continue
+            by_category[(op.tier, op.category)].append((op.action, op.content))
 
+        for (tier, category), ops in by_category.items():
             target = (
                 full_memory.short_term
                 if tier == "short_term"
                 else full_memory.long_term
             )
+            target.apply_batch(category, ops)
+        applied = len(operations)
 
-            if action == "remove":
-                target.remove(category, content)
-            else:
-                target.add(category, content)
-            applied += 1
-
-        # 7. Save to disk
-        store.save_all(full_memory)
+        # 7. Save to disk (most cycles change nothing). Shielded, so a
+        # shutdown cancelling this task can't abandon a half-finished save.
+        if full_memory.is_dirty():
+            await asyncio.shield(store.save_all(full_memory))
         print(
             f"[distill] Extracted {applied} memory operations from recent conversation."
         )
 
-    except json.JSONDecodeError as e:
+    except ValidationError as e:
         print(f"[distill] Failed to parse distillation response: {e}")
     except Exception as e:
         print(f"[distill] Error during distillation: {e}")
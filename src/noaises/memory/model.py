@@ -2,26 +2,69 @@
 
 Categories are dynamic — Claude decides the category names. Storage is
 Markdown with ``## category`` headers and ``- item`` lists.
+
+Every successful mutation also records an op (see ``drain_ops``) so the
+store can journal the delta instead of rewriting the whole tier.
+
+The tiers are plain slotted dataclasses: they're mutated on every memory
+tool call, and the Markdown parser is the only thing that builds them.
+``MemoryOp`` stays a pydantic model since it validates LLM output.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import date
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
 
-class DynamicMemory(BaseModel):
+@dataclass(slots=True)
+class DynamicMemory:
     """Base class for dynamic-category memory."""
 
-    categories: dict[str, list[str]] = Field(default_factory=dict)
+    categories: dict[str, list[str]] = field(default_factory=dict)
+
+    # Ops applied since the last drain — exact items, so replay is deterministic
+    _ops: list[dict[str, Any]] = field(default_factory=list, init=False, repr=False)
+    # Bumped on every mutation — lets callers cache derived views
+    _version: int = field(default=0, init=False, repr=False)
+    # Per-category set of casefolded items for O(1) duplicate checks, so
+    # "Loves coffee" and "loves coffee" count as the same memory
+    _index: dict[str, set[str]] = field(default_factory=dict, init=False, repr=False)
+    # Lowercased copy of each category's list, kept in step with it, so
+    # partial matches in remove/replace don't re-lowercase every item
+    _lowered: dict[str, list[str]] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._index = {
+            cat: {item.casefold() for item in items}
+            for cat, items in self.categories.items()
+        }
+        self._lowered = {
+            cat: [item.lower() for item in items]
+            for cat, items in self.categories.items()
+        }
+
+    @property
+    def version(self) -> int:
+        return self._version
 
     def add(self, category: str, content: str) -> None:
-        """Add *content* under *category*, creating it if needed."""
-        if category not in self.categories:
-            self.categories[category] = []
-        if content not in self.categories[category]:
-            self.categories[category].append(content)
+        """Add *content* under *category*, creating it if needed.
+
+        Skipped if the category already holds it, ignoring case.
+        """
+        index = self._index.setdefault(category, set())
+        items = self.categories.setdefault(category, [])
+        key = content.casefold()
+        if key in index:
+            return
+        index.add(key)
+        items.append(content)
+        self._lowered.setdefault(category, []).append(content.lower())
+        self._record({"action": "add", "category": category, "content": content})
 
     def remove(self, category: str, content: str) -> bool:
         """Remove the first item that contains *content* (case-insensitive partial match).
@@ -30,12 +73,23 @@ class DynamicMemory(BaseModel):
         """
         if category not in self.categories:
             return False
-        for i, item in enumerate(self.categories[category]):
-            if content.lower() in item.lower():
-                self.categories[category].pop(i)
+        items = self.categories[category]
+        lowered = self._lowered[category]
+        needle = content.lower()
+        for i, low in enumerate(lowered):
+            if needle in low:
+                item = items.pop(i)
+                lowered.pop(i)
                 # Clean up empty categories
-                if not self.categories[category]:
+                if not items:
                     del self.categories[category]
+                    del self._index[category]
+                    del self._lowered[category]
+                else:
+                    _discard_key(self._index[category], item, items)
+                self._record(
+                    {"action": "remove", "category": category, "content": item}
+                )
                 return True
         return False
 
@@ -43,30 +97,128 @@ class DynamicMemory(BaseModel):
         """Replace the first item matching *old* (partial) with *new*."""
         if category not in self.categories:
             return False
-        for i, item in enumerate(self.categories[category]):
-            if old.lower() in item.lower():
-                self.categories[category][i] = new
+        items = self.categories[category]
+        lowered = self._lowered[category]
+        needle = old.lower()
+        for i, low in enumerate(lowered):
+            if needle in low:
+                item = items[i]
+                items[i] = new
+                lowered[i] = new.lower()
+                index = self._index[category]
+                _discard_key(index, item, items)
+                index.add(new.casefold())
+                self._record(
+                    {
+                        "action": "replace",
+                        "category": category,
+                        "old": item,
+                        "content": new,
+                    }
+                )
                 return True
         return False
 
+    def apply_batch(self, category: str, ops: list[tuple[str, str]]) -> None:
+        """Apply ``(action, content)`` ops to one category, in order.
+
+        Same semantics as calling :meth:`add` / :meth:`remove` per op, but
+        the list is rebuilt once at the end instead of reshuffled per op.
+        """
+        items = list(self.categories.get(category, ()))
+        lowered = list(self._lowered.get(category, ()))
+        present = set(self._index.get(category, ()))
+        removed: set[int] = set()
+
+        for action, content in ops:
+            if action == "remove":
+                needle = content.lower()
+                for i, low in enumerate(lowered):
+                    if needle in low and i not in removed:
+                        removed.add(i)
+                        item = items[i]
+                        key = item.casefold()
+                        if not any(
+                            x.casefold() == key
+                            for j, x in enumerate(items)
+                            if j not in removed
+                        ):
+                            present.discard(key)
+                        self._record(
+                            {"action": "remove", "category": category, "content": item}
+                        )
+                        break
+            elif (key := content.casefold()) not in present:
+                items.append(content)
+                lowered.append(content.lower())
+                present.add(key)
+                self._record(
+                    {"action": "add", "category": category, "content": content}
+                )
+
+        kept = [i for i in range(len(items)) if i not in removed]
+        if kept:
+            self.categories[category] = [items[i] for i in kept]
+            self._lowered[category] = [lowered[i] for i in kept]
+            self._index[category] = present
+        else:
+            self.categories.pop(category, None)
+            self._lowered.pop(category, None)
+            self._index.pop(category, None)
+
+    def _record(self, op: dict[str, Any]) -> None:
+        self._ops.append(op)
+        self._version += 1
+
+    def drain_ops(self) -> list[dict[str, Any]]:
+        """Return and clear the ops recorded since the last drain."""
+        ops, self._ops = self._ops, []
+        return ops
+
+    def is_dirty(self) -> bool:
+        """True if there are mutations that haven't been saved yet."""
+        return bool(self._ops)
+
     def is_empty(self) -> bool:
         return not any(self.categories.values())
 
 
+def _discard_key(index: set[str], item: str, items: list[str]) -> None:
+    """Drop *item*'s key unless a case-variant duplicate (loaded from disk) remains."""
+    key = item.casefold()
+    if not any(x.casefold() == key for x in items):
+        index.discard(key)
+
+
+@dataclass(slots=True)
 class ShortTermMemory(DynamicMemory):
     """Daily working memory — tasks, context, blockers. Resets each day."""
 
-    date: str = Field(default_factory=lambda: date.today().isoformat())
+    date: str = field(default_factory=lambda: date.today().isoformat())
 
 
+@dataclass(slots=True)
 class LongTermMemory(DynamicMemory):
     """Persistent knowledge — profile, preferences, facts. Survives across sessions."""
 
     pass
 
 
-class FullMemoryContext(BaseModel):
+@dataclass(slots=True)
+class FullMemoryContext:
     """Container for both memory tiers."""
 
-    short_term: ShortTermMemory = Field(default_factory=ShortTermMemory)
-    long_term: LongTermMemory = Field(default_factory=LongTermMemory)
+    short_term: ShortTermMemory = field(default_factory=ShortTermMemory)
+    long_term: LongTermMemory = field(default_factory=LongTermMemory)
+
+    def is_dirty(self) -> bool:
+        return self.short_term.is_dirty() or self.long_term.is_dirty()
+
+
+class MemoryOp(BaseModel):
+    """One memory operation emitted by the distiller."""
+
+    tier: Literal["short_term", "long_term"]
+    category: str = Field(min_length=1)
+    content: str = Field(min_length=1)
+    action: Literal["add", "remove"] = "add"
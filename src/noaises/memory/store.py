@@ -4,156 +4,441 @@ Short-term: daily working context in ``memory/short_term/{date}.md``
 Long-term:  persistent knowledge in ``memory/long_term.md``
 
 Both tiers use Markdown with ``## category`` headers and ``- item`` lists.
+
+The Markdown files are snapshots. ``save_all`` only appends the ops applied
+since the last save to ``memory/memory.wal`` (one JSON object per line);
+``load_full_memory`` replays the journal on top of the snapshots, and
+``compact`` folds it back into them once it grows past 64 KB.
 """
 
 from __future__ import annotations
 
-from datetime import date
+import asyncio
+import gzip
+import json
+import os
+import re
+from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from itertools import chain
 from pathlib import Path
+from typing import Any
 
 from noaises.memory.model import (
     FullMemoryContext,
     LongTermMemory,
     ShortTermMemory,
 )
+from noaises.sessions.engine import encode_jsonl_line, iter_jsonl_lines
+
+# One line of a snapshot: a ``## category`` header or a ``- item`` bullet
+_MD_LINE = re.compile(
+    r"^[ \t]*(?:## +(?P<cat>\S.*?)|- +(?P<item>\S.*?))[ \t\r]*$", re.MULTILINE
+)
+
+# Journal size that triggers a rewrite of the Markdown snapshots
+_WAL_COMPACT_BYTES = 64 * 1024
 
 
 class MemoryStore:
-    """Markdown-based two-tier memory persistence."""
+    """Markdown-based two-tier memory persistence with an append-only journal."""
 
     def __init__(self, memory_dir: Path):
         self.memory_dir = memory_dir
         self.short_term_dir = memory_dir / "short_term"
         self.long_term_path = memory_dir / "long_term.md"
+        self.wal_path = memory_dir / "memory.wal"
+        self._archive_index_path = self.short_term_dir / "_index.jsonl"
 
         self.short_term_dir.mkdir(parents=True, exist_ok=True)
 
+        # Held open for the store's lifetime; O_APPEND makes each write land
+        # at the end of the file, so appends need no seek (O_BINARY: Windows)
+        self._wal_fd = os.open(
+            self.wal_path,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+        self._wal_bytes = os.fstat(self._wal_fd).st_size
+        # All memory disk I/O runs on this one thread: writes land in the
+        # order they were issued, and the default executor stays free for
+        # user-facing waits (console input, screenshots).
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="noaises-memio"
+        )
+        # Serializes saves so a compaction can't truncate ops it didn't snapshot
+        self._lock = asyncio.Lock()
+        # Debounced saves: the armed timer, and the save it last started
+        self._save_timer: asyncio.TimerHandle | None = None
+        self._save_task: asyncio.Task | None = None
+        # (memory identity + tier versions, rendered text) — see build_memory_state
+        self._memory_state_cache: tuple[tuple[int, ...], str] | None = None
+
     # ── Load / Save ────────────────────────────────────────────────
 
     def load_full_memory(self) -> FullMemoryContext:
-        """Load both tiers from disk into an in-memory FullMemoryContext."""
-        return FullMemoryContext(
-            short_term=self._load_short_term(),
-            long_term=self._load_long_term(),
+        """Load both tiers from disk into an in-memory FullMemoryContext.
+
+        Journal ops are replayed on top of the snapshots, then folded back
+        into them so every session starts with an empty journal.
+        """
+        today = date.today().isoformat()
+        short_cats = _read_categories(self._short_term_path(today))
+        long_cats = _read_categories(self.long_term_path)
+
+        ops = self._read_wal()
+        stale: dict[str, list[dict[str, Any]]] = {}
+        for op in ops:
+            if op["tier"] == "long_term":
+                _replay(long_cats, op)
+            elif op["date"] == today:
+                _replay(short_cats, op)
+            else:
+                # Short-term ops from an earlier day belong in that day's file
+                stale.setdefault(op["date"], []).append(op)
+
+        memory = FullMemoryContext(
+            short_term=ShortTermMemory(date=today, categories=short_cats),
+            long_term=LongTermMemory(categories=long_cats),
         )
 
-    def save_all(self, memory: FullMemoryContext) -> None:
-        """Persist both tiers to disk."""
-        self._save_short_term(memory.short_term)
-        self._save_long_term(memory.long_term)
+        if ops:
+            for day, day_ops in stale.items():
+                path = self._short_term_path(day)
+                categories = _read_categories(path)
+                for op in day_ops:
+                    _replay(categories, op)
+                _write_snapshot(
+                    path,
+                    _serialize_short_term_to_markdown(
+                        ShortTermMemory(date=day, categories=categories)
+                    ),
+                )
+            # Startup, before the event loop has anything else to do
+            self._write_snapshots(self._snapshots(memory))
+
+        return memory
+
+    async def save_all(self, memory: FullMemoryContext) -> None:
+        """Journal the ops applied to either tier since the last save.
+
+        Disk I/O runs on the store's I/O thread so the event loop keeps
+        servicing interrupts and voice events while the bytes are written. Turns that
+        didn't touch memory return before taking the lock.
+        """
+        if not memory.is_dirty():
+            return
+        async with self._lock:
+            records = [
+                {"tier": "short_term", "date": memory.short_term.date, **op}
+                for op in memory.short_term.drain_ops()
+            ]
+            records.extend(
+                {"tier": "long_term", **op} for op in memory.long_term.drain_ops()
+            )
+            if not records:
+                return
+
+            data = b"".join(map(encode_jsonl_line, records))
+            await self._run_io(self._append_wal, data)
+            self._wal_bytes += len(data)
+
+            if self._wal_bytes > _WAL_COMPACT_BYTES:
+                await self._compact(memory)
+
+    def schedule_save(self, memory: FullMemoryContext, delay: float = 0.05) -> None:
+        """Save *memory* after *delay* seconds; calls within the window coalesce.
+
+        Each call re-arms the timer, so a burst of mutations is journaled
+        by one save. Only the timer is ever cancelled — a save that has
+        started always runs to completion.
+        """
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = asyncio.get_running_loop().call_later(
+            delay, self._start_save, memory
+        )
 
-    # ── Short-term ────────────────────────────────────────────────
+    def _start_save(self, memory: FullMemoryContext) -> None:
+        self._save_timer = None
+        self._save_task = asyncio.create_task(self.save_all(memory))
+
+    async def flush(self, memory: FullMemoryContext) -> None:
+        """Save now, superseding any pending debounced save."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+        await self.save_all(memory)
+
+    async def compact(self, memory: FullMemoryContext) -> None:
+        """Rewrite both Markdown snapshots from *memory* and empty the journal."""
+        async with self._lock:
+            await self._compact(memory)
+
+    async def _compact(self, memory: FullMemoryContext) -> None:
+        # Serialized here on the loop thread so the snapshot can't change
+        # mid-write; the writes and truncation are one job on the I/O thread.
+        await self._run_io(self._write_snapshots, self._snapshots(memory))
+
+    def _write_snapshots(self, snapshots: list[tuple[Path, str]]) -> None:
+        for path, content in snapshots:
+            _write_snapshot(path, content)
+        self._truncate_wal()
+
+    def _run_io(self, func, *args) -> asyncio.Future:
+        return asyncio.get_running_loop().run_in_executor(
+            self._io_executor, func, *args
+        )
+
+    def _snapshots(self, memory: FullMemoryContext) -> list[tuple[Path, str]]:
+        """Serialize both tiers to (path, Markdown) pairs."""
+        # The snapshots cover everything, including ops not yet journaled
+        memory.short_term.drain_ops()
+        memory.long_term.drain_ops()
+        return [
+            (
+                self._short_term_path(memory.short_term.date),
+                _serialize_short_term_to_markdown(memory.short_term),
+            ),
+            (self.long_term_path, _serialize_long_term_to_markdown(memory.long_term)),
+        ]
+
+    async def close(self) -> None:
+        """Close the journal and the I/O thread. Call once, after the final save.
+
+        Takes the save lock, so a save still in flight (e.g. a shielded
+        distiller save) finishes first.
+        """
+        async with self._lock:
+            if self._wal_fd >= 0:
+                os.close(self._wal_fd)
+                self._wal_fd = -1
+            self._io_executor.shutdown(wait=True)
+
+    def _append_wal(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._wal_fd, view) :]
+
+    def _truncate_wal(self) -> None:
+        os.ftruncate(self._wal_fd, 0)
+        self._wal_bytes = 0
+
+    def archive_old(self, days: int = 7) -> int:
+        """Gzip short-term files older than *days* and log them in a manifest.
+
+        Archived days land in ``short_term/_index.jsonl`` (date, original
+        size, archive name) so lookups don't need to stat every file; see
+        :meth:`archived_days`. Returns the number of files archived.
+        """
+        cutoff = (date.today() - timedelta(days=days)).isoformat()
+        entries: list[dict[str, Any]] = []
+        for path in self.short_term_dir.glob("*.md"):
+            day = path.stem
+            # ISO dates order lexicographically; skip anything that isn't one
+            if day >= cutoff or not _is_iso_date(day):
+                continue
+            data = path.read_bytes()
+            archive = path.with_suffix(".md.gz")
+            with gzip.open(archive, "wb") as f:
+                f.write(data)
+            path.unlink()
+            entries.append({"date": day, "size": len(data), "path": archive.name})
+
+        if entries:
+            entries.sort(key=lambda e: e["date"])
+            with open(self._archive_index_path, "ab") as f:
+                f.write(b"".join(map(encode_jsonl_line, entries)))
+            print(f"[memory] Archived {len(entries)} old short-term file(s).")
+        return len(entries)
+
+    def archived_days(self) -> list[dict[str, Any]]:
+        """Return the archive manifest entries (date, size, path), in archive order."""
+        entries: list[dict[str, Any]] = []
+        if not self._archive_index_path.exists():
+            return entries
+        for line in iter_jsonl_lines(self._archive_index_path):
+            try:
+                entries.append(json.loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                print(f"[memory] Skipping corrupt archive manifest record: {line!r}")
+        return entries
+
+    def _read_wal(self) -> list[dict[str, Any]]:
+        ops: list[dict[str, Any]] = []
+        if not self._wal_bytes:
+            return ops
+        for line in iter_jsonl_lines(self.wal_path):
+            try:
+                ops.append(json.loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # A torn final record from a crash mid-write — drop it
+                print(f"[memory] Skipping corrupt journal record: {line!r}")
+        return ops
+
+    # ── Paths ─────────────────────────────────────────────────────
 
     def _short_term_path(self, day: str | None = None) -> Path:
         day = day or date.today().isoformat()
         return self.short_term_dir / f"{day}.md"
 
-    def _load_short_term(self) -> ShortTermMemory:
-        today = date.today().isoformat()
-        path = self._short_term_path(today)
-        if not path.exists():
-            return ShortTermMemory(date=today)
-        categories = _parse_markdown_to_categories(path.read_text(encoding="utf-8"))
-        return ShortTermMemory(date=today, categories=categories)
-
-    def _save_short_term(self, memory: ShortTermMemory) -> None:
-        content = _serialize_short_term_to_markdown(memory)
-        self._short_term_path(memory.date).write_text(content, encoding="utf-8")
-
-    # ── Long-term ─────────────────────────────────────────────────
-
-    def _load_long_term(self) -> LongTermMemory:
-        if not self.long_term_path.exists():
-            return LongTermMemory()
-        categories = _parse_markdown_to_categories(
-            self.long_term_path.read_text(encoding="utf-8")
+    # ── System-prompt helper ──────────────────────────────────────
+
+    def build_memory_state(self, memory: FullMemoryContext) -> str:
+        """Build a formatted memory-state string for the system prompt.
+
+        Cached until either tier mutates, so unchanged turns (and the
+        distillers) reuse the previous string.
+        """
+        key = (
+            id(memory.short_term),
+            memory.short_term.version,
+            id(memory.long_term),
+            memory.long_term.version,
         )
-        return LongTermMemory(categories=categories)
+        cached = self._memory_state_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        state = self._render_memory_state(memory)
+        self._memory_state_cache = (key, state)
+        return state
+
+    def _render_memory_state(self, memory: FullMemoryContext) -> str:
+        long_term, short_term = memory.long_term, memory.short_term
+        long_empty, short_empty = long_term.is_empty(), short_term.is_empty()
+        if long_empty and short_empty:
+            return "_No memories stored yet._"
 
-    def _save_long_term(self, memory: LongTermMemory) -> None:
-        content = _serialize_long_term_to_markdown(memory)
-        self.long_term_path.write_text(content, encoding="utf-8")
+        return "\n".join(
+            chain(
+                ()
+                if long_empty
+                else _memory_section(
+                    "### About This User (Long-Term)", long_term.categories
+                ),
+                ()
+                if short_empty
+                else _memory_section(
+                    f"\n### Today ({short_term.date}) (Short-Term)",
+                    short_term.categories,
+                ),
+            )
+        )
 
-    # ── System-prompt helper ──────────────────────────────────────
 
-    def build_memory_state(self, memory: FullMemoryContext) -> str:
-        """Build a formatted memory-state string for the system prompt."""
-        lines: list[str] = []
+def _memory_section(header: str, categories: dict[str, list[str]]) -> Iterator[str]:
+    yield header
+    for category, items in categories.items():
+        yield f"**{category}:** {' | '.join(items)}"
 
-        if not memory.long_term.is_empty():
-            lines.append("### About This User (Long-Term)")
-            for category, items in memory.long_term.categories.items():
-                lines.append(f"**{category}:** " + " | ".join(items))
 
-        if not memory.short_term.is_empty():
-            lines.append(f"\n### Today ({memory.short_term.date}) (Short-Term)")
-            for category, items in memory.short_term.categories.items():
-                lines.append(f"**{category}:** " + " | ".join(items))
+def _is_iso_date(value: str) -> bool:
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
 
-        if not lines:
-            return "_No memories stored yet._"
 
-        return "\n".join(lines)
+# ── Journal replay ────────────────────────────────────────────────
+
+
+def _replay(categories: dict[str, list[str]], op: dict[str, Any]) -> None:
+    """Apply one journaled op to a raw category dict.
+
+    Ops carry the exact item text, so this matches exactly rather than
+    going through the partial-match logic of ``DynamicMemory``.
+    """
+    category = op["category"]
+    items = categories.get(category)
+    action = op["action"]
+    if action == "add":
+        if items is None:
+            categories[category] = [op["content"]]
+        elif op["content"] not in items:
+            items.append(op["content"])
+    elif items is None:
+        return
+    elif action == "remove":
+        if op["content"] in items:
+            items.remove(op["content"])
+            if not items:
+                del categories[category]
+    elif action == "replace" and op["old"] in items:
+        items[items.index(op["old"])] = op["content"]
+
+
+# ── Snapshot files ────────────────────────────────────────────────
+
+
+def _read_categories(path: Path) -> dict[str, list[str]]:
+    if not path.exists():
+        return {}
+    return _parse_markdown_to_categories(path.read_text(encoding="utf-8"))
+
+
+def _write_snapshot(path: Path, content: str) -> None:
+    """Atomically replace *path* with *content*, fsynced before returning.
+
+    Written to a sibling temp file first, so a crash mid-write leaves the
+    previous snapshot intact (and the journal still covers it).
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 
 # ── Markdown serialization ────────────────────────────────────────
 
 
 def _serialize_short_term_to_markdown(memory: ShortTermMemory) -> str:
-    lines = [f"# Short-Term Memory: {memory.date}", ""]
-    if not memory.categories:
-        lines.append("_No memories stored yet_")
-    else:
-        for category, items in sorted(memory.categories.items()):
-            lines.append(f"## {category}")
-            for item in items:
-                lines.append(f"- {item}")
-            lines.append("")
-    return "\n".join(lines) + "\n"
+    return _serialize_markdown(
+        f"# Short-Term Memory: {memory.date}\n\n", memory.categories
+    )
 
 
 def _serialize_long_term_to_markdown(memory: LongTermMemory) -> str:
-    lines = ["# Long-Term Memory", ""]
-    if not memory.categories:
-        lines.append("_No memories stored yet_")
-    else:
-        for category, items in sorted(memory.categories.items()):
-            lines.append(f"## {category}")
+    return _serialize_markdown("# Long-Term Memory\n\n", memory.categories)
+
+
+def _serialize_markdown(title: str, categories: dict[str, list[str]]) -> str:
+    """Render *categories* under *title* in a single join, with no line list."""
+    if not categories:
+        return title + "_No memories stored yet_\n"
+
+    def chunks() -> Iterator[str]:
+        yield title
+        for category, items in sorted(categories.items()):
+            yield f"## {category}\n"
             for item in items:
-                lines.append(f"- {item}")
-            lines.append("")
-    return "\n".join(lines) + "\n"
+                yield f"- {item}\n"
+            yield "\n"
+
+    return "".join(chunks())
 
 
 # ── Markdown parsing ──────────────────────────────────────────────
 
 
 def _parse_markdown_to_categories(content: str) -> dict[str, list[str]]:
-    """Parse Markdown with ``## category`` headers and ``- item`` lists."""
-    categories: dict[str, list[str]] = {}
+    """Parse Markdown with ``## category`` headers and ``- item`` lists.
+
+    Top-level headings, blanks, and italic placeholders match neither
+    group, so the scan skips them without any per-line Python work.
+    """
+    categories: defaultdict[str, list[str]] = defaultdict(list)
     current_category: str | None = None
 
-    for line in content.split("\n"):
-        line = line.strip()
-
-        # Skip top-level headings, blanks, and italic placeholders
-        if (
-            not line
-            or line.startswith("# ")
-            or (line.startswith("_") and line.endswith("_"))
-        ):
-            continue
-
-        # Category header
-        if line.startswith("## "):
-            current_category = line[3:].strip()
-            if current_category not in categories:
-                categories[current_category] = []
-
-        # List item
-        elif line.startswith("- ") and current_category:
-            item = line[2:].strip()
-            if item:
-                categories[current_category].append(item)
-
-    return categories
+    for m in _MD_LINE.finditer(content):
+        if m.lastgroup == "cat":
+            current_category = m["cat"]
+            categories[current_category]  # touch: keeps empty categories
+        elif current_category is not None:
+            categories[current_category].append(m["item"])
+
+    return dict(categories)
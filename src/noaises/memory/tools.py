@@ -9,8 +9,6 @@ from __future__ import annotations
 
 from typing import Any
 
-from claude_agent_sdk import create_sdk_mcp_server, tool
-
 from noaises.memory.model import FullMemoryContext
 
 MEMORY_META_PROMPT = """\
@@ -35,6 +33,7 @@ MEMORY_TOOL_NAMES = [
 
 def create_memory_mcp_server(memory: FullMemoryContext) -> Any:
     """Create an in-process MCP server with memory tools bound to *memory*."""
+    from claude_agent_sdk import create_sdk_mcp_server, tool
 
     @tool(
         "memory_store",
@@ -1,18 +1,19 @@
 """Personality distiller — evolves companion personality every N turns.
 
-Mirrors ``memory/distiller.py``. Runs in the background via
-``asyncio.create_task``. Uses Haiku to analyze recent conversation and
+Mirrors ``memory/distiller.py``. Runs in the background on
+``main.py``'s distill worker. Uses Haiku to analyze recent conversation and
 current personality state, then returns a full-state replacement for the
 evolution fields.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
-
-import anthropic
+import re
 
 from noaises.config import settings
+from noaises.memory.distiller import get_client
 from noaises.memory.model import FullMemoryContext
 from noaises.memory.store import MemoryStore
 from noaises.personality.engine import (
@@ -62,6 +63,20 @@ Frame as "likely...", "seems to...", "probably...".
     max_guesses=MAX_COMPANION_GUESSES,
 )
 
+# Same fence handling as memory/distiller.py
+_FENCE_STRIP = re.compile(r"\A```[a-zA-Z0-9]*[ \t]*\n?|\n?```\s*\Z")
+
+# Tone and traits only need the gist of each message, so long pastes are
+# clipped per message and the transcript keeps at most its most recent tail
+_MAX_MESSAGE_CHARS = 500
+_MAX_TRANSCRIPT_CHARS = 8192
+
+# Minimum cacheable prompt length of the default distill model (Haiku 4.5),
+# in tokens, and a rough chars-per-token ratio to estimate against it;
+# shorter prefixes are never cached, so marking them buys nothing
+_MIN_CACHEABLE_TOKENS = 4096
+_CHARS_PER_TOKEN = 4
+
 
 async def distill_personality(
     personality: PersonalityEngine,
@@ -71,20 +86,21 @@ async def distill_personality(
 ) -> None:
     """Run background personality distillation (fire-and-forget safe)."""
     try:
-        # 1. Load recent session entries
-        entries = session.get_today()
+        # 1. Load recent session entries (off the loop — reads the whole log)
+        entries = await asyncio.to_thread(session.get_today)
         if not entries:
             return
         recent = entries[-20:]
 
         # 2. Build transcript
-        transcript_lines: list[str] = []
-        for entry in recent:
-            role = "User" if entry["sender"] == "user" else "Assistant"
-            transcript_lines.append(f"{role}: {entry['text']}")
-        transcript = "\n\n".join(transcript_lines)
-
-        # 3. Build context
+        transcript = "\n\n".join(
+            f"{'User' if e['sender'] == 'user' else 'Assistant'}: "
+            f"{e['text'][:_MAX_MESSAGE_CHARS]}"
+            for e in recent
+        )[-_MAX_TRANSCRIPT_CHARS:]
+
+        # 3. Build context (sorted keys keep the serialized state
+        # byte-identical between calls when nothing changed)
         current_state = json.dumps(
             {
                 "tone_adjustments": personality.evolution.get("tone_adjustments", []),
@@ -92,32 +108,46 @@ async def distill_personality(
                 "companion_guesses": personality.evolution.get("companion_guesses", []),
             },
             indent=2,
+            sort_keys=True,
         )
         memory_state = store.build_memory_state(full_memory)
 
-        user_message = (
-            f"## Current Personality Evolution State\n```json\n{current_state}\n```\n\n"
-            f"## Current Memory State\n{memory_state}\n\n"
-            f"## Recent Conversation\n{transcript}"
-        )
-
-        # 4. Call Haiku for analysis
-        client = anthropic.AsyncAnthropic()
-        response = await client.messages.create(
+        # 4. Call Haiku for analysis. Stable content comes first; the
+        # transcript is the only per-call block. The stable prefix is marked
+        # for prompt caching only once it's long enough to be cached at all.
+        state_block: dict = {
+            "type": "text",
+            "text": (
+                "## Current Personality Evolution State\n"
+                f"```json\n{current_state}\n```\n\n"
+                f"## Current Memory State\n{memory_state}\n\n"
+            ),
+        }
+        prefix_chars = len(PERSONALITY_DISTILLATION_PROMPT) + len(state_block["text"])
+        if prefix_chars >= _MIN_CACHEABLE_TOKENS * _CHARS_PER_TOKEN:
+            state_block["cache_control"] = {"type": "ephemeral"}
+        response = await get_client().messages.create(
             model=settings.memory_distill_model,
             max_tokens=1024,
             system=PERSONALITY_DISTILLATION_PROMPT,
-            messages=[{"role": "user", "content": user_message}],
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        state_block,
+                        {
+                            "type": "text",
+                            "text": f"## Recent Conversation\n{transcript}",
+                        },
+                    ],
+                }
+            ],
         )
 
         raw_text = response.content[0].text.strip()
 
         # 5. Strip markdown code fences if present
-        if raw_text.startswith("```"):
-            first_newline = raw_text.index("\n") if "\n" in raw_text else len(raw_text)
-            raw_text = raw_text[first_newline + 1 :]
-            if raw_text.endswith("```"):
-                raw_text = raw_text[:-3].rstrip()
+        raw_text = _FENCE_STRIP.sub("", raw_text).strip()
 
         # 6. Parse and apply
         result = json.loads(raw_text)
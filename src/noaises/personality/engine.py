@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import tomllib
 from datetime import datetime, timezone
 from pathlib import Path
@@ -32,6 +33,10 @@ You are {name}, an autonomous AI companion that lives locally on the host's mach
 - Stay in character. You are {name}, not "an AI assistant."
 """
 
+# Everything before the evolution section only depends on the TOML config,
+# so it's rendered once per engine; the tail is formatted per turn.
+_PROMPT_HEAD, _, _PROMPT_TAIL = SYSTEM_PROMPT_TEMPLATE.partition("{evolution_section}")
+
 
 class PersonalityEngine:
     """Loads personality config, builds system prompts, tracks evolution."""
@@ -40,6 +45,9 @@ class PersonalityEngine:
         self.config_path = config_path
         self.personality_dir = personality_dir
         self.evolution_path = personality_dir / "personality_evolution.json"
+        # Per-turn interaction count lives in its own tiny file, so a turn
+        # doesn't rewrite the whole evolution document
+        self.counter_path = personality_dir / "counter.json"
 
         # Load base personality from TOML
         with open(config_path, "rb") as f:
@@ -69,6 +77,29 @@ class PersonalityEngine:
         # Migration for existing installs missing companion_guesses
         self.evolution.setdefault("companion_guesses", [])
 
+        # The counter file is ahead of the evolution file between evolutions
+        try:
+            counted = json.loads(self.counter_path.read_bytes())["interaction_count"]
+        except (OSError, ValueError, KeyError, TypeError):
+            counted = 0
+        self.evolution["interaction_count"] = max(
+            self.evolution.get("interaction_count", 0), counted
+        )
+
+        trait_lines = (
+            ", ".join(f"{k}: {v}" for k, v in self.traits.items())
+            if self.traits
+            else "none specified"
+        )
+        # Rendered on first use; only changes when apply_evolution() does
+        self._evolution_section: str | None = None
+        self._prompt_head = _PROMPT_HEAD.format(
+            name=self.name,
+            tone=self.tone,
+            verbosity=self.verbosity,
+            traits=trait_lines,
+        )
+
     def build_system_prompt(
         self,
         memory_context: str,
@@ -76,74 +107,76 @@ class PersonalityEngine:
         memory_guidance: str = "",
     ) -> str:
         """Build the full system prompt with personality + memory + evolution."""
-        # Format traits
-        trait_lines = (
-            ", ".join(f"{k}: {v}" for k, v in self.traits.items())
-            if self.traits
-            else "none specified"
+        if self._evolution_section is None:
+            self._evolution_section = self._render_evolution_section()
+
+        return (
+            self._prompt_head
+            + self._evolution_section
+            + _PROMPT_TAIL.format(
+                name=self.name,
+                memory_guidance=memory_guidance,
+                memory_context=memory_context
+                or "Nothing yet — this is a new relationship.",
+                short_term_context=short_term_context or "No recent conversation.",
+            )
         )
 
-        # Format evolution section
-        evolution_section = ""
+    def _render_evolution_section(self) -> str:
         adjustments = self.evolution.get("tone_adjustments", [])
         learned = self.evolution.get("learned_traits", [])
         guesses = self.evolution.get("companion_guesses", [])
-        if adjustments or learned or guesses:
-            parts = []
-            if adjustments:
-                parts.append("- Tone adjustments: " + "; ".join(adjustments))
-            if learned:
-                parts.append("- Learned preferences: " + "; ".join(learned))
-            if guesses:
-                guess_lines = []
-                for g in guesses:
-                    guess = g.get("guess", "")
-                    confidence = g.get("confidence", "unknown")
-                    since = g.get("since", "unknown")
-                    guess_lines.append(
-                        f"  - {guess} ({confidence} confidence, since {since})"
-                    )
-                parts.append(
-                    "- Working hypotheses about the user:\n" + "\n".join(guess_lines)
+        if not (adjustments or learned or guesses):
+            return ""
+        parts = []
+        if adjustments:
+            parts.append("- Tone adjustments: " + "; ".join(adjustments))
+        if learned:
+            parts.append("- Learned preferences: " + "; ".join(learned))
+        if guesses:
+            guess_lines = []
+            for g in guesses:
+                guess = g.get("guess", "")
+                confidence = g.get("confidence", "unknown")
+                since = g.get("since", "unknown")
+                guess_lines.append(
+                    f"  - {guess} ({confidence} confidence, since {since})"
                 )
-            evolution_section = "\n## Personality Evolution\n" + "\n".join(parts) + "\n"
-
-        return SYSTEM_PROMPT_TEMPLATE.format(
-            name=self.name,
-            tone=self.tone,
-            verbosity=self.verbosity,
-            traits=trait_lines,
-            evolution_section=evolution_section,
-            memory_guidance=memory_guidance,
-            memory_context=memory_context
-            or "Nothing yet — this is a new relationship.",
-            short_term_context=short_term_context or "No recent conversation.",
-        )
+            parts.append(
+                "- Working hypotheses about the user:\n" + "\n".join(guess_lines)
+            )
+        return "\n## Personality Evolution\n" + "\n".join(parts) + "\n"
 
     def record_interaction(self):
         """Increment interaction count and persist."""
         self.evolution["interaction_count"] += 1
-        self._save_evolution()
+        _write_atomic(
+            self.counter_path,
+            b'{"interaction_count": %d}\n' % self.evolution["interaction_count"],
+        )
 
     def apply_evolution(self, result: dict):
         """Apply a full-state evolution result from the personality distiller.
 
         *result* is the complete desired state — not a delta. Keys:
         ``tone_adjustments``, ``learned_traits``, ``companion_guesses``.
-        Each is capped to its maximum length.
+        Each is capped to its maximum length. A result identical to the
+        current state is a no-op (nothing is written).
         """
-        if "tone_adjustments" in result:
-            self.evolution["tone_adjustments"] = list(result["tone_adjustments"])[
-                :MAX_TONE_ADJUSTMENTS
-            ]
-        if "learned_traits" in result:
-            self.evolution["learned_traits"] = list(result["learned_traits"])[
-                :MAX_LEARNED_TRAITS
-            ]
-        if "companion_guesses" in result:
-            self.evolution["companion_guesses"] = list(result["companion_guesses"])[
-                :MAX_COMPANION_GUESSES
-            ]
+        changed = False
+        for key, cap in (
+            ("tone_adjustments", MAX_TONE_ADJUSTMENTS),
+            ("learned_traits", MAX_LEARNED_TRAITS),
+            ("companion_guesses", MAX_COMPANION_GUESSES),
+        ):
+            if key in result:
+                value = list(result[key])[:cap]
+                if value != self.evolution.get(key):
+                    self.evolution[key] = value
+                    changed = True
+        if not changed:
+            return
+        self._evolution_section = None
 
         self.evolution["last_evolved"] = datetime.now(timezone.utc).isoformat(
             timespec="seconds"
@@ -152,7 +185,16 @@ class PersonalityEngine:
 
     def _save_evolution(self):
         self.personality_dir.mkdir(parents=True, exist_ok=True)
-        self.evolution_path.write_text(
-            json.dumps(self.evolution, indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
+        _write_atomic(
+            self.evolution_path,
+            (json.dumps(self.evolution, indent=2, ensure_ascii=False) + "\n").encode(
+                "utf-8"
+            ),
         )
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    # Temp file + rename, so a crash mid-write can't truncate the state
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
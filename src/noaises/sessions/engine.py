@@ -7,9 +7,53 @@ them independently.
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
+import threading
+import time
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
+
+_READ_CHUNK = 64 * 1024
+
+# Write-behind: appends are buffered and written together once this many
+# are pending, or by a background flusher this long after the first one
+_FLUSH_EVERY = 8
+_FLUSH_AFTER = 0.5  # seconds
+
+# Built once: json.dumps with non-default options constructs a new encoder
+# on every call.
+_JSONL_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_jsonl_line(obj: Any) -> bytes:
+    """Serialize *obj* as one compact UTF-8 JSONL line, newline included."""
+    return (_JSONL_ENCODER.encode(obj) + "\n").encode("utf-8")
+
+
+def iter_jsonl_lines(path: Path, chunk_size: int = _READ_CHUNK) -> Iterator[bytes]:
+    """Yield the non-blank lines of a JSONL file as raw bytes.
+
+    Reads fixed-size chunks and splits on ``\\n`` as it goes, so peak
+    memory is one chunk plus the longest line, not the whole file. The
+    final line is yielded even without a trailing newline.
+    """
+    buf = bytearray()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            buf += chunk
+            start = 0
+            while (end := buf.find(b"\n", start)) != -1:
+                line = bytes(buf[start:end])
+                if line and not line.isspace():
+                    yield line
+                start = end + 1
+            del buf[:start]
+    if buf and not buf.isspace():
+        yield bytes(buf)
 
 
 class SessionEngine:
@@ -18,44 +62,174 @@ class SessionEngine:
     def __init__(self, sessions_dir: Path):
         self.sessions_dir = sessions_dir
         self.sessions_dir.mkdir(parents=True, exist_ok=True)
+        # Entries (and their encoded lines) not yet written, all for one day
+        self._pending: list[dict] = []
+        self._pending_lines: list[bytes] = []
+        self._pending_day: str | None = None
+        # Append descriptor for the day last written, kept open between
+        # batches and reopened when the date rolls over; O_APPEND makes
+        # each write land at the end of the file (O_BINARY: Windows)
+        self._fd = -1
+        self._fd_day: str | None = None
+        # Parsed entries of one day's log, valid up to byte _cache_pos and
+        # modification time _cache_mtime; only newer bytes get parsed.
+        self._cache: list[dict] = []
+        self._cache_day: str | None = None
+        self._cache_pos = 0
+        self._cache_mtime = 0
+        # Guards the buffer and the cache: appends come from the event loop
+        # and worker threads, reads from worker threads, flushes from the
+        # flusher thread (started on the first append)
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._flusher: threading.Thread | None = None
 
-    def _today_path(self) -> Path:
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        return self.sessions_dir / f"{today}.jsonl"
+    def _today_path(self, now: datetime | None = None) -> Path:
+        day = (now or datetime.now(timezone.utc)).date().isoformat()
+        return self.sessions_dir / f"{day}.jsonl"
 
     def append(self, sender: str, text: str, artifact: str | None = None):
         """Append an entry to today's session log."""
+        # One clock read for both the timestamp and the file's date
+        now = datetime.now(timezone.utc)
         entry: dict = {
             "sender": sender,
             "text": text,
-            "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "ts": now.isoformat(timespec="seconds"),
         }
         if artifact:
             entry["artifact"] = artifact
 
-        with open(self._today_path(), "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        day = now.date().isoformat()
+        line = encode_jsonl_line(entry)
+        with self._lock:
+            if day != self._pending_day:
+                self._flush_locked()  # earlier entries belong to another file
+                self._pending_day = day
+            self._pending.append(entry)
+            self._pending_lines.append(line)
+            if len(self._pending) >= _FLUSH_EVERY:
+                self._flush_locked()
+            elif len(self._pending) == 1:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_loop, name="noaises-session", daemon=True
+                    )
+                    self._flusher.start()
+                self._wake.notify()
+
+    async def append_async(self, sender: str, text: str, artifact: str | None = None):
+        """Like :meth:`append`, with the disk write done on a worker thread.
+
+        The append lock keeps entries whole and in call order per awaiter.
+        """
+        await asyncio.to_thread(self.append, sender, text, artifact)
+
+    def flush(self) -> None:
+        """Write any buffered entries to their day's log."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush buffered entries and close the log. Call once on shutdown."""
+        with self._lock:
+            self._flush_locked()
+            self._close_locked()
+
+    def _close_locked(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+            self._fd_day = None
+
+    def _flush_loop(self) -> None:
+        """Flusher thread — writes each batch ``_FLUSH_AFTER`` after it starts."""
+        with self._lock:
+            while True:
+                while not self._pending:
+                    self._wake.wait()
+                # Let entries arriving shortly after join this batch
+                deadline = time.monotonic() + _FLUSH_AFTER
+                while self._pending and (left := deadline - time.monotonic()) > 0:
+                    self._wake.wait(left)
+                try:
+                    self._flush_locked()
+                except OSError as e:
+                    # Entries stay buffered; retried on the next round
+                    print(f"[session] Failed to write session log: {e}")
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        if self._pending_day != self._fd_day:
+            self._close_locked()
+            self._fd = os.open(
+                self.sessions_dir / f"{self._pending_day}.jsonl",
+                os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0),
+                0o644,
+            )
+            self._fd_day = self._pending_day
+        data = b"".join(self._pending_lines)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view) :]
+        st = os.fstat(self._fd)
+
+        # Extend the read cache in place when it was current up to this batch
+        start = st.st_size - len(data)
+        if self._pending_day == self._cache_day and self._cache_pos == start:
+            self._cache.extend(self._pending)
+            self._cache_pos = st.st_size
+            self._cache_mtime = st.st_mtime_ns
+        self._pending.clear()
+        self._pending_lines.clear()
 
     def get_today(self) -> list[dict]:
-        """Return all entries from today's session."""
+        """Return all entries from today's session.
+
+        Entries are cached; a changed file is read from the last parsed
+        offset, so only lines appended since the previous call are parsed.
+        Buffered appends are written out first.
+        """
         path = self._today_path()
-        if not path.exists():
-            return []
-        entries = []
-        for line in path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if line:
-                entries.append(json.loads(line))
-        return entries
+        day = path.stem
+        with self._lock:
+            self._flush_locked()
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                return []
+            unchanged = st.st_size == self._cache_pos
+            if (
+                day != self._cache_day
+                or st.st_size < self._cache_pos
+                or (unchanged and st.st_mtime_ns != self._cache_mtime)
+            ):
+                # New day, or the file was truncated/rewritten: reparse it all
+                self._cache, self._cache_day, self._cache_pos = [], day, 0
+            elif unchanged:
+                return list(self._cache)
+
+            with open(path, "rb") as f:
+                f.seek(self._cache_pos)
+                tail = f.read()
+            # The last split piece is empty or a partially written line; it
+            # is left for the next call
+            *lines, partial = tail.split(b"\n")
+            # json.loads takes bytes directly — no text decode of the tail
+            self._cache.extend(
+                json.loads(line) for line in lines if line and not line.isspace()
+            )
+            self._cache_pos += len(tail) - len(partial)
+            self._cache_mtime = st.st_mtime_ns
+            return list(self._cache)
 
     def get_today_summary(self, limit: int = 20) -> str:
         """Return a formatted summary of recent session entries for the system prompt."""
         entries = self.get_today()
         if not entries:
             return ""
-        recent = entries[-limit:]
-        lines = []
-        for e in recent:
-            role = "User" if e["sender"] == "user" else "You"
-            lines.append(f"- {role}: {e['text'][:200]}")
-        return "\n".join(lines)
+        return "\n".join(
+            f"- {'User' if e['sender'] == 'user' else 'You'}: {e['text'][:200]}"
+            for e in entries[-limit:]
+        )
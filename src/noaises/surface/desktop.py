@@ -12,10 +12,13 @@ the page loads, avoiding the race where WebView2 paints a white frame first.
 
 from __future__ import annotations
 
+import queue
 import threading
 import time
 from pathlib import Path
 
+from noaises.logger import log
+
 
 class DesktopSurface:
     """Manages the always-on-top persona window."""
@@ -23,11 +26,18 @@ class DesktopSurface:
     def __init__(self, html_dir: Path):
         self._html_dir = html_dir
         self._state = "idle"
+        self._sent_state: str | None = None  # last state pushed to JS
         self._window = None
         self._on_closed_callback = None
         self._suppress_close = (
             False  # True while programmatically hidden (e.g. screen capture)
         )
+        # JS snippets for the webview, run in order by one long-lived thread;
+        # None stops it
+        self._js_queue: queue.Queue[str | None] = queue.Queue()
+        threading.Thread(
+            target=self._js_worker, name="noaises-surface-js", daemon=True
+        ).start()
 
     @property
     def state(self) -> str:
@@ -104,23 +114,38 @@ class DesktopSurface:
 
     def destroy(self):
         """Close the webview window (call from any thread)."""
+        self._js_queue.put_nowait(None)
         if self._window:
             self._window.destroy()
 
     def set_state(self, state: str):
         """Update animation state: idle, listening, thinking, searching, speaking, sleeping, seeing, remembering.
 
-        Non-blocking: dispatches evaluate_js on a daemon thread so the
-        asyncio event loop is never stalled waiting for the webview's
-        main thread to finish rendering.
+        Non-blocking: queues the evaluate_js call for the JS worker thread
+        so the asyncio event loop is never stalled waiting for the
+        webview's main thread to finish rendering. Repeating the current
+        state is a no-op — each push is a JS bridge round-trip.
         """
         self._state = state
-        if self._window:
-            threading.Thread(
-                target=self._window.evaluate_js,
-                args=(f"setPersonaState('{state}')",),
-                daemon=True,
-            ).start()
+        if self._window and state != self._sent_state:
+            self._sent_state = state
+            self._js_queue.put_nowait(f"setPersonaState('{state}')")
+
+    def _js_worker(self):
+        while (js := self._js_queue.get()) is not None:
+            # Only the newest state matters if several piled up meanwhile.
+            # A None among them means destroy() ran: the window is going
+            # away, so the pending state is dropped rather than pushed.
+            try:
+                while (newer := self._js_queue.get_nowait()) is not None:
+                    js = newer
+                return
+            except queue.Empty:
+                pass
+            try:
+                self._window.evaluate_js(js)
+            except Exception as e:  # noqa: BLE001 — error type varies by GUI backend
+                log("WARN", f"[surface] Failed to push persona state: {e!r}")
 
     # -- JS API bridge (called from JavaScript) --
 
@@ -8,8 +8,6 @@ from __future__ import annotations
 
 from typing import Any
 
-from claude_agent_sdk import create_sdk_mcp_server, tool
-
 from noaises.vision.pipeline import VisionPipeline
 
 CAMERA_META_PROMPT = """\
@@ -30,6 +28,7 @@ CAMERA_TOOL_NAMES = [
 
 def create_camera_mcp_server(vision_pipeline: VisionPipeline) -> Any:
     """Create an in-process MCP server with camera tools bound to *vision_pipeline*."""
+    from claude_agent_sdk import create_sdk_mcp_server, tool
 
     @tool(
         "camera_on",
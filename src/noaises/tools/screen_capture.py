@@ -18,21 +18,14 @@ from pathlib import Path
 import mss
 import mss.tools
 
-# Patterns that signal the user wants noaises to look at their screen.
-_SCREEN_PATTERNS = [
-    re.compile(
-        r"\b(?:check|look at|see|show|view|what(?:'s| is) on)\b.*\b(?:screen|desktop|monitor|display)\b",
-        re.IGNORECASE,
-    ),
-    re.compile(
-        r"\b(?:check|see|look at|tell me)\b.*\bwhat (?:i'm|i am|im) (?:working|doing|looking)\b",
-        re.IGNORECASE,
-    ),
-    re.compile(
-        r"\b(?:what(?:'s| is)|check)\b.*\b(?:working on|doing)\b.*\b(?:right now|at the moment|currently)\b",
-        re.IGNORECASE,
-    ),
-]
+# Phrasings that signal the user wants noaises to look at their screen,
+# as one alternation so detection is a single regex scan.
+_SCREEN_PATTERN = re.compile(
+    r"\b(?:check|look at|see|show|view|what(?:'s| is) on)\b.*\b(?:screen|desktop|monitor|display)\b"
+    r"|\b(?:check|see|look at|tell me)\b.*\bwhat (?:i'm|i am|im) (?:working|doing|looking)\b"
+    r"|\b(?:what(?:'s| is)|check)\b.*\b(?:working on|doing)\b.*\b(?:right now|at the moment|currently)\b",
+    re.IGNORECASE,
+)
 
 _CLEANUP_AGE = timedelta(hours=1)
 
@@ -113,14 +106,19 @@ class CaptureScreenTool:
     @staticmethod
     def detect_intent(user_input: str) -> bool:
         """Return True if the user's message implies they want a screen capture."""
-        return any(p.search(user_input) for p in _SCREEN_PATTERNS)
+        return _SCREEN_PATTERN.search(user_input) is not None
 
     def _cleanup_old(self):
-        """Delete screenshots older than 1 hour to prevent disk bloat."""
-        cutoff = datetime.now() - _CLEANUP_AGE
-        for png in self._save_dir.glob("screen_*.png"):
+        """Delete screenshots older than 1 hour to prevent disk bloat.
+
+        Filenames embed the capture time in sortable form, so the oldest
+        come first and the scan stops at the first one inside the window.
+        """
+        cutoff = f"screen_{datetime.now() - _CLEANUP_AGE:%Y%m%d_%H%M%S}.png"
+        for png in sorted(self._save_dir.glob("screen_*.png")):
+            if png.name >= cutoff:
+                break
             try:
-                if datetime.fromtimestamp(png.stat().st_mtime) < cutoff:
-                    png.unlink()
+                png.unlink()
             except OSError:
                 pass
@@ -4,19 +4,24 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from typing import TYPE_CHECKING
 
 from noaises.vision.camera import CameraCapture
 from noaises.vision.model import VisionModel
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
 class VisionPipeline:
     """Coordinates CameraCapture and VisionModel lifecycle.
 
+    - ``preload()`` loads the model up front (blocking, call before the loop).
     - ``start()`` loads the model (if needed) and opens the camera.
     - ``stop()`` closes the camera but keeps the model loaded.
-    - ``flush_and_describe()`` grabs buffered frames and runs inference.
+    - ``flush_frames()`` grabs buffered frames; ``describe()`` runs inference.
     - ``shutdown()`` releases everything (camera + model).
     """
 
@@ -37,6 +42,11 @@ class VisionPipeline:
     def pending_frame_count(self) -> int:
         return self._camera.pending_frame_count
 
+    def preload(self) -> None:
+        """Load the model now (blocking) so the first ``camera_on`` is instant."""
+        if not self._model.is_loaded:
+            self._model.load()
+
     async def start(self) -> str:
         """Load model if needed, start camera, capture initial frame and describe.
 
@@ -63,15 +73,20 @@ class VisionPipeline:
         self._camera.stop()
         return "Camera is now off."
 
-    async def flush_and_describe(self) -> str | None:
-        """Flush buffered frames and describe them. Returns None if camera inactive."""
+    def flush_frames(self) -> list[np.ndarray]:
+        """Grab and clear the buffered frames in a single buffer drain.
+
+        Empty if the camera is inactive. Callers see the frame count
+        before paying for inference with :meth:`describe`.
+        """
         if not self._camera.is_active:
-            return None
+            return []
+        return self._camera.flush()
 
-        frames = self._camera.flush()
+    async def describe(self, frames: list[np.ndarray]) -> str | None:
+        """Describe *frames*; None if there are none."""
         if not frames:
             return None
-
         return await self._model.describe_frames(frames)
 
     def shutdown(self) -> None:
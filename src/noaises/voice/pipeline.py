@@ -185,9 +185,10 @@ class VoicePipeline:
         # Barge-in monitor — started once TTS begins
         monitor_task: asyncio.Task | None = None
 
+        is_interrupted = interrupt.is_set
         try:
             async for event in events:
-                if interrupt.is_interrupted:
+                if is_interrupted():
                     was_interrupted = True
                     break
 
@@ -345,8 +346,10 @@ class VoicePipeline:
                 blocksize=chunk_samples,
             )
             stream.start()
+            is_interrupted = interrupt.is_set
+            is_shutdown = self._shutdown.is_set
             try:
-                while not interrupt.is_interrupted and not self._shutdown.is_set():
+                while not is_interrupted() and not is_shutdown():
                     data, _ = stream.read(chunk_samples)
                     chunk = data[:, 0] if data.ndim > 1 else data.flatten()
                     rms = float(np.sqrt(np.mean(chunk**2)))
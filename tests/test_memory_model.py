@@ -0,0 +1,51 @@
+"""DynamicMemory: case-insensitive duplicates and partial-match removal."""
+
+from noaises.memory.model import LongTermMemory
+
+
+def test_add_skips_case_variants():
+    memory = LongTermMemory()
+    memory.add("preferences", "Loves coffee")
+    memory.add("preferences", "loves COFFEE")
+
+    assert memory.categories == {"preferences": ["Loves coffee"]}
+    assert len(memory.drain_ops()) == 1
+    assert not memory.is_dirty()
+
+
+def test_remove_matches_ignoring_case_and_frees_the_key():
+    memory = LongTermMemory()
+    memory.add("preferences", "Loves coffee")
+    memory.add("preferences", "Hates rain")
+
+    assert memory.remove("preferences", "COFFEE")
+    assert memory.categories == {"preferences": ["Hates rain"]}
+    assert not memory.remove("preferences", "coffee")
+
+    # Once removed, a case variant is a new memory again
+    memory.add("preferences", "loves coffee")
+    assert memory.categories["preferences"] == ["Hates rain", "loves coffee"]
+
+
+def test_remove_last_item_drops_category():
+    memory = LongTermMemory()
+    memory.add("pets", "Has a cat")
+    assert memory.remove("pets", "cat")
+    assert memory.categories == {}
+    assert [op["action"] for op in memory.drain_ops()] == ["add", "remove"]
+
+
+def test_apply_batch_matches_add_and_remove():
+    memory = LongTermMemory(categories={"facts": ["Lives in Athens"]})
+    memory.apply_batch(
+        "facts",
+        [
+            ("add", "LIVES IN ATHENS"),
+            ("add", "Works remotely"),
+            ("remove", "athens"),
+            ("add", "lives in athens"),
+        ],
+    )
+
+    assert memory.categories == {"facts": ["Works remotely", "lives in athens"]}
+    assert [op["action"] for op in memory.drain_ops()] == ["add", "remove", "add"]
@@ -0,0 +1,84 @@
+"""MemoryStore journal: replay on load and compaction into the snapshots."""
+
+import asyncio
+
+from noaises.memory import store as store_module
+from noaises.memory.store import MemoryStore
+
+
+def _save(store: MemoryStore, memory) -> None:
+    async def run():
+        await store.save_all(memory)
+        await store.close()
+
+    asyncio.run(run())
+
+
+def test_replay_skips_torn_last_record(tmp_path):
+    store = MemoryStore(tmp_path)
+    memory = store.load_full_memory()
+    memory.long_term.add("preferences", "Loves coffee")
+    memory.short_term.add("tasks", "Ship the release")
+    _save(store, memory)
+
+    # A crash mid-write leaves half a record at the end of the journal
+    with open(store.wal_path, "ab") as f:
+        f.write(b'{"tier":"long_term","action":"add","categ')
+
+    reloaded = MemoryStore(tmp_path)
+    memory = reloaded.load_full_memory()
+    asyncio.run(reloaded.close())
+
+    assert memory.long_term.categories == {"preferences": ["Loves coffee"]}
+    assert memory.short_term.categories == {"tasks": ["Ship the release"]}
+    # Replayed ops are folded into the snapshots and the journal emptied
+    assert "- Loves coffee" in store.long_term_path.read_text(encoding="utf-8")
+    assert store.wal_path.stat().st_size == 0
+
+
+def test_save_compacts_past_threshold(tmp_path, monkeypatch):
+    monkeypatch.setattr(store_module, "_WAL_COMPACT_BYTES", 512)
+    store = MemoryStore(tmp_path)
+    memory = store.load_full_memory()
+
+    async def run():
+        memory.long_term.add("facts", "Has a cat")
+        await store.save_all(memory)
+        assert store.wal_path.stat().st_size > 0
+        assert not store.long_term_path.exists()
+
+        for i in range(20):
+            memory.long_term.add("facts", f"Fact number {i}")
+        await store.save_all(memory)
+        await store.close()
+
+    asyncio.run(run())
+
+    assert store.wal_path.stat().st_size == 0
+    snapshot = store.long_term_path.read_text(encoding="utf-8")
+    assert "- Has a cat" in snapshot
+    assert "- Fact number 19" in snapshot
+
+    reloaded = MemoryStore(tmp_path)
+    memory = reloaded.load_full_memory()
+    asyncio.run(reloaded.close())
+    assert len(memory.long_term.categories["facts"]) == 21
+
+
+def test_archive_old_gzips_and_lists_old_days(tmp_path):
+    store = MemoryStore(tmp_path)
+    for day in ("2020-01-02", "2020-01-01"):
+        (store.short_term_dir / f"{day}.md").write_text(f"## tasks\n- {day}\n")
+    (store.short_term_dir / "notes.md").write_text("not a day\n")
+
+    assert store.archive_old() == 2
+    asyncio.run(store.close())
+
+    assert sorted(p.name for p in store.short_term_dir.iterdir()) == [
+        "2020-01-01.md.gz",
+        "2020-01-02.md.gz",
+        "_index.jsonl",
+        "notes.md",
+    ]
+    assert [e["date"] for e in store.archived_days()] == ["2020-01-01", "2020-01-02"]
+    assert store.archived_days()[0]["path"] == "2020-01-01.md.gz"
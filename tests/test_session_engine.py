@@ -0,0 +1,47 @@
+"""SessionEngine: buffered appends and the get_today cache."""
+
+from noaises.sessions.engine import SessionEngine
+
+
+def _texts(engine: SessionEngine) -> list[str]:
+    return [e["text"] for e in engine.get_today()]
+
+
+def test_get_today_sees_buffered_appends(tmp_path):
+    engine = SessionEngine(tmp_path)
+    engine.append("user", "hello")
+    assert _texts(engine) == ["hello"]
+
+    # Still buffered when read: the read flushes and extends the cache
+    engine.append("agent", "hi there")
+    engine.append("user", "how are you?")
+    assert _texts(engine) == ["hello", "hi there", "how are you?"]
+    engine.close()
+
+    assert len(engine._today_path().read_bytes().splitlines()) == 3
+
+
+def test_get_today_picks_up_external_writes(tmp_path):
+    engine = SessionEngine(tmp_path)
+    engine.append("user", "first")
+    assert _texts(engine) == ["first"]
+
+    path = engine._today_path()
+    with open(path, "ab") as f:
+        f.write(b'{"sender":"user","text":"from elsewhere","ts":"x"}\n')
+    engine.append("agent", "second")
+    assert _texts(engine) == ["first", "from elsewhere", "second"]
+
+    # A rewritten (shorter) file is reparsed from the start
+    path.write_bytes(b'{"sender":"user","text":"only","ts":"x"}\n')
+    assert _texts(engine) == ["only"]
+    engine.close()
+
+
+def test_close_writes_pending_entries(tmp_path):
+    engine = SessionEngine(tmp_path)
+    engine.append("user", "one")
+    engine.append("user", "two")
+    engine.close()
+
+    assert _texts(SessionEngine(tmp_path)) == ["one", "two"]